@@ -5,15 +5,23 @@ This module provides the command-line interface and entry point for the agent.
 """
 
 import argparse
+import asyncio
+import copy
+import functools
+import hashlib
+import itertools
+import json
 import logging
 import os
+import re
 import sys
-import yaml
-from typing import Dict, Any, Optional
+import time
+from typing import Awaitable, Dict, Any, List, Optional, TYPE_CHECKING
 
-from azure_devops_agent.core.orchestrator import Orchestrator
-from azure_devops_agent.security.credential_manager import CredentialManager
-from azure_devops_agent.security.audit_logger import AuditLogger
+# Heavy dependencies (yaml, the Azure DevOps SDK, ...) are imported lazily so
+# that `--help` and argument errors return quickly
+if TYPE_CHECKING:
+    from azure_devops_agent.core.orchestrator import Orchestrator
 
 # Set up logging
 logging.basicConfig(
@@ -26,6 +34,164 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Parsed configurations are persisted here so later processes can skip YAML
+# parsing; the directory and files are private to the current user
+CONFIG_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "azdevops")
+
+# Configuration keys whose (non-empty) values are secrets; configurations
+# containing any are never written to the cache
+_SECRET_KEY_RE = re.compile(r'token|password|passwd|secret|credential|api_?key|(?:^|_)pat$', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """Return the libyaml C loader if available, otherwise the pure-Python one."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+def _contains_secret(value: Any) -> bool:
+    """
+    Check whether a parsed configuration contains a non-empty secret value.
+    
+    Args:
+        value: Parsed configuration, or a part of it.
+        
+    Returns:
+        True if any key that names a secret has a non-empty value.
+    """
+    if isinstance(value, dict):
+        return any(
+            (isinstance(key, str) and _SECRET_KEY_RE.search(key) and item not in (None, ''))
+            or _contains_secret(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return any(_contains_secret(item) for item in value)
+    return False
+
+def _private_cache_dir() -> Optional[str]:
+    """
+    Return the configuration cache directory, creating it private to the current user.
+    
+    Returns:
+        The directory path, or None if it cannot be used safely (not owned by
+        the current user, or writable by others).
+    """
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, mode=0o700, exist_ok=True)
+        st = os.stat(CONFIG_CACHE_DIR)
+    except OSError as e:
+        logger.debug("Configuration cache unavailable: %s", e)
+        return None
+    
+    if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        logger.warning("Not using configuration cache %s: not private to the current user", CONFIG_CACHE_DIR)
+        return None
+    return CONFIG_CACHE_DIR
+
+def _read_cached_config(cache_file: str) -> Optional[Any]:
+    """
+    Read a cached configuration, removing the cache file if it is unusable.
+    
+    Args:
+        cache_file: Path of the cache file.
+        
+    Returns:
+        The cached configuration, or None if there is no usable cache file.
+    """
+    try:
+        fd = os.open(cache_file, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    except OSError:
+        return None
+    
+    try:
+        with os.fdopen(fd, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+                raise ValueError("cache file is not private to the current user")
+            return json.loads(f.read())
+    except (OSError, ValueError) as e:
+        # Remove it so it is rewritten from the YAML
+        logger.debug("Discarding unusable configuration cache: %s", e)
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+        return None
+
+def _write_cached_config(cache_file: str, config: Any) -> None:
+    """
+    Cache a parsed configuration as JSON in a file readable only by the current user.
+    
+    Configurations containing secrets, or that do not survive a JSON round
+    trip unchanged (dates, non-string keys), are not cached.
+    
+    Args:
+        cache_file: Path of the cache file.
+        config: Parsed configuration.
+    """
+    if _contains_secret(config):
+        logger.debug("Not caching configuration: it contains secrets")
+        return
+    
+    try:
+        data = json.dumps(config)
+    except (TypeError, ValueError):
+        return
+    if json.loads(data) != config:
+        return
+    
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_NOFOLLOW', 0), 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Failed to write configuration cache: %s", e)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=16)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file, using the on-disk cache when possible.
+    
+    The modification time and size are part of the cache key so that edits
+    to the file invalidate the in-process cache.
+    
+    Args:
+        config_path: Path to the configuration file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+        
+    Returns:
+        Parsed configuration dictionary.
+    """
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    
+    cache_dir = _private_cache_dir()
+    cache_file = None
+    if cache_dir is not None:
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        cache_file = os.path.join(cache_dir, f"{digest}.json")
+        config = _read_cached_config(cache_file)
+        if config is not None:
+            return config
+    
+    import yaml
+    config = yaml.load(data, Loader=_yaml_loader())
+    
+    if cache_file is not None:
+        _write_cached_config(cache_file, config)
+    
+    return config
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
@@ -37,15 +203,174 @@ def load_config(config_path: str) -> Dict[str, Any]:
         Configuration dictionary.
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        st = os.stat(config_path)
+        # Copy so callers cannot mutate the cached object
+        config = copy.deepcopy(_parse_config(config_path, st.st_mtime_ns, st.st_size))
         
-        logger.info(f"Loaded configuration from {config_path}")
+        logger.info("Loaded configuration from %s", config_path)
         return config
     except Exception as e:
-        logger.error(f"Failed to load configuration: {str(e)}")
+        logger.error("Failed to load configuration: %s", e)
         return {}
 
+def load_config_header(config_path: str, max_lines: int = 40) -> Dict[str, Any]:
+    """
+    Load only the leading portion of a YAML configuration file.
+    
+    This is useful when only top-level keys (e.g. ``azure_devops.organization``)
+    are needed to select between candidate configuration files. If the prefix
+    cannot be parsed on its own, the full file is loaded instead.
+    
+    Args:
+        config_path: Path to the configuration file.
+        max_lines: Maximum number of lines to read from the start of the file.
+        
+    Returns:
+        Configuration dictionary (possibly partial).
+    """
+    import yaml
+    
+    try:
+        with open(config_path, 'r') as f:
+            header = ''.join(itertools.islice(f, max_lines))
+        config = yaml.load(header, Loader=_yaml_loader())
+    except yaml.YAMLError:
+        # The cut may fall inside a construct the prefix cannot parse alone
+        return load_config(config_path)
+    except Exception as e:
+        logger.error("Failed to load configuration header: %s", e)
+        return {}
+    
+    if not isinstance(config, dict):
+        return load_config(config_path)
+    
+    return config
+
+def select_config(config_paths: List[str], organization: Optional[str] = None) -> str:
+    """
+    Pick the configuration file to use from a list of candidates.
+    
+    Only the header of each candidate is parsed to read its organization,
+    so non-matching files are rejected without parsing their whole body.
+    
+    Args:
+        config_paths: Candidate configuration file paths, in order of preference.
+        organization: Azure DevOps organization to look for (optional).
+        
+    Returns:
+        The first candidate configured for the organization, or the first
+        candidate if there is no organization or no candidate matches.
+    """
+    if organization is None or len(config_paths) == 1:
+        return config_paths[0]
+    
+    for config_path in config_paths:
+        config_organization = (load_config_header(config_path).get('azure_devops') or {}).get('organization')
+        # The organization may lie beyond the header; read the whole file then
+        if config_organization is None:
+            config_organization = (load_config(config_path).get('azure_devops') or {}).get('organization')
+        if config_organization == organization:
+            return config_path
+    
+    logger.warning("No configuration for organization %s, using %s", organization, config_paths[0])
+    return config_paths[0]
+
+# Processing results after which a polled task is not picked up again
+_HANDLED_TASK_STATUSES = frozenset({"completed", "clarification_requested"})
+
+# Attempts at a failing task before polling gives up on it
+MAX_TASK_ATTEMPTS = 5
+
+# Delay before retrying a failed task, doubled after each further failure (seconds)
+TASK_RETRY_BASE_DELAY = 60
+TASK_RETRY_MAX_DELAY = 3600
+
+async def poll_loop(orchestrator: 'Orchestrator', 
+                    interval: int = 30,
+                    max_concurrency: int = 1) -> None:
+    """
+    Continuously poll Azure DevOps for new tasks and process them.
+    
+    Failed tasks are retried with exponential backoff, up to
+    MAX_TASK_ATTEMPTS attempts.
+    
+    Args:
+        orchestrator: Orchestrator used to list and process tasks.
+        interval: Seconds to wait between polls.
+        max_concurrency: Maximum number of tasks processed at the same time.
+    """
+    # Tasks completed, handed off for clarification, or given up on
+    handled_tasks = set()
+    # Failed tasks: number of failed attempts and when the next may start
+    failures: Dict[str, int] = {}
+    retry_at: Dict[str, float] = {}
+    
+    while True:
+        try:
+            pending_tasks = await orchestrator.list_new_tasks()
+        except Exception as e:
+            logger.error("Failed to poll for tasks: %s", e)
+        else:
+            # Forget tasks that are no longer pending, so the bookkeeping stays
+            # bounded by the size of the query result
+            pending = set(pending_tasks)
+            handled_tasks.intersection_update(pending)
+            for task_id in [t for t in failures if t not in pending]:
+                del failures[task_id]
+                retry_at.pop(task_id, None)
+            
+            now = time.monotonic()
+            task_ids = [
+                t for t in pending_tasks
+                if t not in handled_tasks and retry_at.get(t, 0) <= now
+            ]
+            
+            if task_ids:
+                logger.info("Found %d new tasks", len(task_ids))
+                results = await orchestrator.process_tasks(task_ids, max_concurrency)
+                
+                for task_id, result in zip(task_ids, results):
+                    status = result.get("status")
+                    if status in _HANDLED_TASK_STATUSES:
+                        handled_tasks.add(task_id)
+                        failures.pop(task_id, None)
+                        retry_at.pop(task_id, None)
+                    
+                    if status == "completed":
+                        logger.info("Task %s processed successfully", task_id)
+                    elif status == "clarification_requested":
+                        logger.info("Clarification requested for task %s", task_id)
+                    else:
+                        logger.error("Failed to process task %s: %s", task_id, result.get('message', 'Unknown error'))
+                        attempts = failures[task_id] = failures.get(task_id, 0) + 1
+                        if attempts >= MAX_TASK_ATTEMPTS:
+                            logger.error("Giving up on task %s after %d attempts", task_id, attempts)
+                            handled_tasks.add(task_id)
+                            del failures[task_id]
+                            retry_at.pop(task_id, None)
+                        else:
+                            delay = min(TASK_RETRY_BASE_DELAY * 2 ** (attempts - 1), TASK_RETRY_MAX_DELAY)
+                            retry_at[task_id] = time.monotonic() + delay
+                            logger.info("Retrying task %s in %d seconds", task_id, delay)
+        
+        await asyncio.sleep(interval)
+
+async def _run_and_aclose(orchestrator: 'Orchestrator', coro: Awaitable[Any]) -> Any:
+    """
+    Await a coroutine, then close the orchestrator's connections on the same event loop.
+    
+    Args:
+        orchestrator: Orchestrator whose connections to close.
+        coro: Coroutine to run.
+        
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        return await coro
+    finally:
+        await orchestrator.aclose()
+
 def main() -> None:
     """Main entry point for the Azure DevOps Integration Agent."""
     parser = argparse.ArgumentParser(description="Azure DevOps Integration Agent")
@@ -53,8 +378,16 @@ def main() -> None:
     parser.add_argument(
         "--config", 
         type=str, 
-        default="config/agent_config.yaml",
-        help="Path to configuration file"
+        nargs="+",
+        default=["config/agent_config.yaml"],
+        help="Path to configuration file; with several paths, the first one "
+             "configured for --organization is used"
+    )
+    
+    parser.add_argument(
+        "--organization", 
+        type=str, 
+        help="Azure DevOps organization (overrides the configuration)"
     )
     
     parser.add_argument(
@@ -69,6 +402,13 @@ def main() -> None:
         help="Poll for tasks continuously"
     )
     
+    parser.add_argument(
+        "--poll-interval", 
+        type=int, 
+        default=30,
+        help="Seconds to wait between polls"
+    )
+    
     parser.add_argument(
         "--log-level", 
         type=str, 
@@ -79,11 +419,15 @@ def main() -> None:
     
     args = parser.parse_args()
     
+    from azure_devops_agent.core.orchestrator import Orchestrator
+    from azure_devops_agent.security.credential_manager import CredentialManager
+    from azure_devops_agent.security.audit_logger import AuditLogger
+    
     # Set log level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
     # Load configuration
-    config = load_config(args.config)
+    config = load_config(select_config(args.config, args.organization))
     
     # Set up audit logger
     audit_config = config.get("logging", {})
@@ -104,7 +448,9 @@ def main() -> None:
     
     # Get Azure DevOps credentials
     azure_devops_config = config.get("azure_devops", {})
-    organization = azure_devops_config.get("organization") or os.environ.get("AZURE_DEVOPS_ORG")
+    organization = (args.organization
+                    or azure_devops_config.get("organization")
+                    or os.environ.get("AZURE_DEVOPS_ORG"))
     project = azure_devops_config.get("project") or os.environ.get("AZURE_DEVOPS_PROJECT")
     
     if not organization:
@@ -123,54 +469,61 @@ def main() -> None:
     work_dir = repo_config.get("work_dir")
     
     # Set up orchestrator
-    orchestrator = Orchestrator(
+    with Orchestrator(
         organization_url=f"https://dev.azure.com/{organization}",
         personal_access_token=pat,
         project=project,
         work_dir=work_dir
-    )
-    
-    # Log agent start
-    audit_logger.log_event(
-        event_type=audit_logger.EVENT_CONFIGURATION,
-        severity=audit_logger.SEVERITY_INFO,
-        message="Azure DevOps Integration Agent started",
-        details={
-            "organization": organization,
-            "project": project,
-            "polling_enabled": args.poll
-        }
-    )
-    
-    if args.task_id:
-        # Process a specific task
-        logger.info(f"Processing task {args.task_id}")
+    ) as orchestrator:
         
-        audit_logger.log_task_access(
-            task_id=args.task_id,
-            user="agent",
-            action="process"
+        # Log agent start
+        audit_logger.log_event(
+            event_type=audit_logger.EVENT_CONFIGURATION,
+            severity=audit_logger.SEVERITY_INFO,
+            message="Azure DevOps Integration Agent started",
+            details={
+                "organization": organization,
+                "project": project,
+                "polling_enabled": args.poll
+            }
         )
         
-        result = orchestrator.process_task(args.task_id)
+        if args.task_id:
+            # Process a specific task
+            logger.info("Processing task %s", args.task_id)
+            
+            audit_logger.log_task_access(
+                task_id=args.task_id,
+                user="agent",
+                action="process"
+            )
+            
+            result = asyncio.run(_run_and_aclose(orchestrator, orchestrator.process_task(args.task_id)))
+            
+            if result.get("status") == "completed":
+                logger.info("Task %s processed successfully", args.task_id)
+                logger.info("PR created: %s", result.get('pull_request', {}).get('pr_url', 'N/A'))
+            else:
+                logger.error("Failed to process task %s: %s", args.task_id, result.get('message', 'Unknown error'))
         
-        if result.get("status") == "completed":
-            logger.info(f"Task {args.task_id} processed successfully")
-            logger.info(f"PR created: {result.get('pull_request', {}).get('pr_url', 'N/A')}")
-        else:
-            logger.error(f"Failed to process task {args.task_id}: {result.get('message', 'Unknown error')}")
-    
-    elif args.poll:
-        # Poll for tasks
-        logger.info("Starting to poll for tasks")
+        elif args.poll:
+            # Poll for tasks
+            logger.info("Starting to poll for tasks")
+            
+            task_config = config.get("task_processing", {})
+            
+            try:
+                asyncio.run(_run_and_aclose(orchestrator, poll_loop(
+                    orchestrator,
+                    interval=args.poll_interval,
+                    max_concurrency=task_config.get("parallel_tasks", 1)
+                )))
+            except KeyboardInterrupt:
+                logger.info("Stopped polling for tasks")
         
-        # This would be implemented to continuously poll for tasks
-        # For simplicity, this is not implemented in this example
-        logger.error("Polling not implemented yet")
-    
-    else:
-        # No action specified
-        parser.print_help()
+        else:
+            # No action specified
+            parser.print_help()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
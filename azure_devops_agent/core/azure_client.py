@@ -6,15 +6,45 @@ read task details, and create pull requests.
 """
 
 import os
+import sys
 import logging
+import functools
+import re
 from typing import Dict, List, Optional, Any, Union
 from azure.devops.connection import Connection
-from azure.devops.v6_0.work_item_tracking.models import WorkItem, WorkItemExpand
-from azure.devops.v6_0.git.models import GitPullRequest, GitRepository
+from azure.devops.v6_0.work_item_tracking.models import (
+    WorkItem, WorkItemExpand, WorkItemBatchGetRequest, Wiql
+)
+from azure.devops.v6_0.git.models import GitPullRequest, GitRepository, IdentityRefWithVote
 from msrest.authentication import BasicAuthentication
 
 logger = logging.getLogger(__name__)
 
+# Common field names that might contain repository information, in priority order
+_REPO_FIELDS = (
+    'Custom.Repository',
+    'Custom.RepositoryUrl',
+    'Microsoft.VSTS.Build.SourceRepository',
+    'Custom.GitRepository',
+)
+_REPO_FIELDS_SET = frozenset(_REPO_FIELDS)
+
+# Repository URLs embedded in work item descriptions
+_REPO_URL_RE = re.compile(r'(https?://[^\s]+?(?:github\.com|dev\.azure\.com)[^\s]+?(?:\.git|(?=/)))')
+_REPO_URL_LOOKBEHIND = 200
+_REPO_URL_LOOKAHEAD = 500
+
+# Prefix for fully qualified branch ref names
+_HEADS = 'refs/heads/'
+
+# Maximum number of IDs accepted by the work items batch endpoint
+WORK_ITEM_BATCH_SIZE = 200
+
+@functools.lru_cache(maxsize=256)
+def _ref(branch: str) -> str:
+    """Return the interned fully qualified ref name for a branch."""
+    return sys.intern(_HEADS + branch)
+
 class AzureDevOpsClient:
     """Client for interacting with Azure DevOps API."""
 
@@ -35,30 +65,128 @@ class AzureDevOpsClient:
         self.connection = Connection(base_url=organization_url, creds=self.credentials)
         self.project = project
         
-        # Initialize clients for different services
-        self.work_item_client = self.connection.clients.get_work_item_tracking_client()
-        self.git_client = self.connection.clients.get_git_client()
-        self.build_client = self.connection.clients.get_build_client()
-        self.test_client = self.connection.clients.get_test_client()
+        # Clients for different services are created on first use
+        self._work_item_client = None
+        self._git_client = None
+        self._build_client = None
+        self._test_client = None
+        self._identity_client = None
         
-        logger.info(f"Azure DevOps client initialized for {organization_url}")
+        logger.info("Azure DevOps client initialized for %s", organization_url)
+
+    @property
+    def work_item_client(self):
+        """Work item tracking client, created on first access."""
+        if self._work_item_client is None:
+            self._work_item_client = self.connection.clients.get_work_item_tracking_client()
+        return self._work_item_client
 
-    def get_work_item(self, work_item_id: int) -> WorkItem:
+    @property
+    def git_client(self):
+        """Git client, created on first access."""
+        if self._git_client is None:
+            self._git_client = self.connection.clients.get_git_client()
+        return self._git_client
+
+    @property
+    def build_client(self):
+        """Build client, created on first access."""
+        if self._build_client is None:
+            self._build_client = self.connection.clients.get_build_client()
+        return self._build_client
+
+    @property
+    def test_client(self):
+        """Test client, created on first access."""
+        if self._test_client is None:
+            self._test_client = self.connection.clients.get_test_client()
+        return self._test_client
+
+    @property
+    def identity_client(self):
+        """Identity client, created on first access."""
+        if self._identity_client is None:
+            self._identity_client = self.connection.clients.get_identity_client()
+        return self._identity_client
+
+    def get_work_item(self, 
+                      work_item_id: int,
+                      fields: Optional[List[str]] = None,
+                      include_relations: bool = False) -> WorkItem:
         """
         Get details of a work item by its ID.
         
+        By default only the work item fields are returned; relations, links and
+        attachments are left out since task processing does not use them.
+        
         Args:
             work_item_id: The ID of the work item to retrieve.
+            fields: Specific fields to retrieve (default: all fields).
+            include_relations: Whether to include relations and links.
             
         Returns:
             WorkItem object containing details of the specified work item.
         """
-        logger.info(f"Fetching work item {work_item_id}")
+        logger.info("Fetching work item %s", work_item_id)
+        
+        if include_relations:
+            return self.work_item_client.get_work_item(
+                work_item_id, 
+                expand=WorkItemExpand.ALL
+            )
+        
+        if fields:
+            return self.work_item_client.get_work_item(work_item_id, fields=fields)
+        
         return self.work_item_client.get_work_item(
             work_item_id, 
-            expand=WorkItemExpand.ALL
+            expand=WorkItemExpand.FIELDS
         )
     
+    def get_work_items_batch(self, 
+                             work_item_ids: List[int],
+                             fields: Optional[List[str]] = None) -> Dict[int, WorkItem]:
+        """
+        Get several work items using the work items batch endpoint.
+        
+        IDs are fetched in chunks of WORK_ITEM_BATCH_SIZE, so N work items cost
+        ceil(N / 200) round trips instead of N.
+        
+        Args:
+            work_item_ids: IDs of the work items to retrieve.
+            fields: Fields to retrieve (default: all fields).
+            
+        Returns:
+            Dictionary mapping work item IDs to WorkItem objects.
+        """
+        work_items = {}
+        
+        for start in range(0, len(work_item_ids), WORK_ITEM_BATCH_SIZE):
+            ids_chunk = [int(i) for i in work_item_ids[start:start + WORK_ITEM_BATCH_SIZE]]
+            logger.info("Fetching batch of %d work items", len(ids_chunk))
+            
+            batch = self.work_item_client.get_work_items_batch(
+                WorkItemBatchGetRequest(ids=ids_chunk, fields=fields)
+            )
+            for work_item in batch:
+                work_items[work_item.id] = work_item
+        
+        return work_items
+    
+    def query_work_item_ids(self, query: str) -> List[int]:
+        """
+        Run a WIQL query and return the IDs of the matching work items.
+        
+        Args:
+            query: WIQL query string.
+            
+        Returns:
+            List of work item IDs.
+        """
+        logger.info("Querying work items")
+        result = self.work_item_client.query_by_wiql(Wiql(query=query))
+        return [work_item.id for work_item in (result.work_items or [])]
+    
     def extract_task_details(self, work_item: WorkItem) -> Dict[str, Any]:
         """
         Extract relevant details from a work item.
@@ -70,6 +198,7 @@ class AzureDevOpsClient:
             Dictionary containing parsed task details.
         """
         fields = work_item.fields
+        tags = fields.get('System.Tags') or ''
         
         # Extract common fields
         task_details = {
@@ -83,7 +212,7 @@ class AzureDevOpsClient:
             'created_date': fields.get('System.CreatedDate', ''),
             'changed_date': fields.get('System.ChangedDate', ''),
             'work_item_type': fields.get('System.WorkItemType', ''),
-            'tags': fields.get('System.Tags', '').split(';') if fields.get('System.Tags', '') else [],
+            'tags': tags.split(';') if tags else [],
             'priority': fields.get('Microsoft.VSTS.Common.Priority', 0),
         }
         
@@ -92,7 +221,7 @@ class AzureDevOpsClient:
         if repo_info:
             task_details['repository'] = repo_info
             
-        logger.info(f"Extracted details for task {work_item.id}")
+        logger.info("Extracted details for task %s", work_item.id)
         return task_details
     
     def _extract_repository_info(self, fields: Dict[str, Any]) -> Optional[Dict[str, str]]:
@@ -108,26 +237,29 @@ class AzureDevOpsClient:
         Returns:
             Dictionary with repository details or None if not found.
         """
-        # Common field names that might contain repository information
-        repo_field_candidates = [
-            'Custom.Repository',
-            'Custom.RepositoryUrl',
-            'Microsoft.VSTS.Build.SourceRepository',
-            'Custom.GitRepository',
-        ]
-        
-        for field in repo_field_candidates:
-            if field in fields and fields[field]:
-                return {'url': fields[field]}
+        # Only probe the candidate fields if at least one is present
+        if _REPO_FIELDS_SET & fields.keys():
+            for field in _REPO_FIELDS:
+                if fields.get(field):
+                    return {'url': fields[field]}
         
         # Try to extract from description or other fields if specific field not found
         description = fields.get('System.Description', '')
-        if description and ('github.com/' in description or 'dev.azure.com/' in description):
-            # Basic extraction logic - would need more robust implementation in production
-            import re
-            repo_urls = re.findall(r'(https?://[^\s]+?(?:github\.com|dev\.azure\.com)[^\s]+?(?:\.git|(?=/)))', description)
-            if repo_urls:
-                return {'url': repo_urls[0]}
+        if description:
+            github_index = description.find('github.com/')
+            azure_index = description.find('dev.azure.com/')
+            hits = [i for i in (github_index, azure_index) if i != -1]
+            
+            if hits:
+                # Only scan a window around the first host match instead of the
+                # whole (possibly very long) description
+                start = min(hits)
+                window = description[max(0, start - _REPO_URL_LOOKBEHIND):start + _REPO_URL_LOOKAHEAD]
+                
+                # Basic extraction logic - would need more robust implementation in production
+                repo_urls = _REPO_URL_RE.findall(window)
+                if repo_urls:
+                    return {'url': repo_urls[0]}
                 
         return None
     
@@ -161,27 +293,26 @@ class AzureDevOpsClient:
             raise ValueError("Project must be specified either in constructor or method call")
             
         # Create PR object
+        work_item_refs = [{"id": work_item_id} for work_item_id in map(str, work_item_ids or ())]
         pull_request = GitPullRequest(
-            source_ref_name=f"refs/heads/{source_branch}",
-            target_ref_name=f"refs/heads/{target_branch}",
+            source_ref_name=_ref(source_branch),
+            target_ref_name=_ref(target_branch),
             title=title,
             description=description,
-            work_item_refs=[{"id": str(id)} for id in (work_item_ids or [])]
+            work_item_refs=work_item_refs
         )
         
-        logger.info(f"Creating PR from {source_branch} to {target_branch} in {repository_id}")
+        logger.info("Creating PR from %s to %s in %s", source_branch, target_branch, repository_id)
         created_pr = self.git_client.create_pull_request(pull_request, repository_id, project)
         
-        # Add reviewers if specified
+        # Add all reviewers in a single request
         if reviewers and created_pr.pull_request_id:
-            for reviewer in reviewers:
-                self.git_client.create_pull_request_reviewer(
-                    {"id": reviewer},
-                    repository_id,
-                    created_pr.pull_request_id,
-                    reviewer,
-                    project
-                )
+            self.git_client.create_pull_request_reviewers(
+                [IdentityRefWithVote(id=reviewer) for reviewer in reviewers],
+                repository_id,
+                created_pr.pull_request_id,
+                project
+            )
         
         return created_pr
     
@@ -209,5 +340,19 @@ class AzureDevOpsClient:
             work_item_id: ID of the work item
             comment: Comment text to add
         """
-        logger.info(f"Adding comment to work item {work_item_id}")
-        self.work_item_client.add_comment(comment, work_item_id)
\ No newline at end of file
+        logger.info("Adding comment to work item %s", work_item_id)
+        self.work_item_client.add_comment(comment, work_item_id)
+    
+    def get_identity_id(self, name: str) -> Optional[str]:
+        """
+        Look up the identity ID for an email address or display name.
+        
+        Args:
+            name: Email address or display name of the user.
+            
+        Returns:
+            Identity ID or None if no matching identity was found.
+        """
+        logger.info("Looking up identity for %s", name)
+        identities = self.identity_client.read_identities(search_filter='General', filter_value=name)
+        return identities[0].id if identities else None
\ No newline at end of file
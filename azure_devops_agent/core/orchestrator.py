@@ -6,21 +6,40 @@ from task interpretation to pull request creation.
 """
 
 import os
+import asyncio
 import logging
+import re
 import tempfile
+import time
 import shutil
+import weakref
 from typing import Dict, List, Optional, Any, Union, Tuple
-from datetime import datetime
 
 from azure_devops_agent.core.azure_client import AzureDevOpsClient
 from azure_devops_agent.core.task_processor import TaskProcessor
 from azure_devops_agent.core.pr_manager import PRManager
 from azure_devops_agent.repository.git_handler import GitHandler
+from azure_devops_agent.implementation.code_generator import CodeGenerator
 from azure_devops_agent.implementation.implementation_manager import ImplementationManager
 from azure_devops_agent.testing.test_runner import TestRunner
 
 logger = logging.getLogger(__name__)
 
+# Repository name at the end of an Azure Repos URL
+_GIT_ID_RE = re.compile(r'/_git/([^/]+)$')
+
+def _wiql_string(value: str) -> str:
+    """
+    Escape a value for use inside a single-quoted WIQL string literal.
+    
+    Args:
+        value: Raw value.
+        
+    Returns:
+        Value with single quotes doubled.
+    """
+    return value.replace("'", "''")
+
 class Orchestrator:
     """
     Main orchestrator for the Azure DevOps Integration Agent.
@@ -60,32 +79,81 @@ class Orchestrator:
             # Create a temporary directory if none specified
             self.temp_dir = tempfile.mkdtemp(prefix='azdevops_')
             self.work_dir = self.temp_dir
+            # Remove the temporary directory on close, garbage collection or exit
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self.temp_dir, True)
         else:
             self.temp_dir = None
+            self._finalizer = None
+            os.makedirs(self.work_dir, exist_ok=True)
         
         # Initialize task processor
         self.task_processor = TaskProcessor(self.azure_client)
         
-        # PR manager will be initialized when needed
-        self.pr_manager = None
+        # Code generator shared by all tasks, so they share one AI model client:
+        # its request concurrency limit, connection pool and response cache
+        self.code_generator = CodeGenerator()
+        
+        # PR manager shared by all tasks, so its reviewer and identity caches
+        # are reused; each task gets a copy bound to its repository
+        self.pr_manager = PRManager(self.azure_client)
         
-        logger.info(f"Orchestrator initialized with work directory: {self.work_dir}")
+        logger.info("Orchestrator initialized with work directory: %s", self.work_dir)
     
-    def __del__(self):
-        """Clean up temporary directory when the object is destroyed."""
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-                logger.info(f"Cleaned up temporary directory {self.temp_dir}")
-            except Exception as e:
-                logger.error(f"Failed to clean up temporary directory: {str(e)}")
+    def close(self) -> None:
+        """Close the AI model client's synchronous connections and clean up the temporary working directory."""
+        self.code_generator.ai_model_client.close()
+        if self._finalizer and self._finalizer.alive:
+            self._finalizer()
+            logger.info("Cleaned up temporary directory %s", self.temp_dir)
     
-    def process_task(self, task_id: str) -> Dict[str, Any]:
+    async def aclose(self) -> None:
+        """
+        Close the AI model client's connections, then clean up as close() does.
+        
+        Must be awaited on the event loop that processed the tasks, since the
+        async HTTP client is bound to it.
+        """
+        await self.code_generator.ai_model_client.aclose()
+        self.close()
+    
+    def __enter__(self) -> 'Orchestrator':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    async def list_new_tasks(self, 
+                             work_item_type: str = 'Task',
+                             state: str = 'New') -> List[str]:
+        """
+        List the IDs of tasks waiting to be processed.
+        
+        Args:
+            work_item_type: Work item type to look for (default: Task).
+            state: Work item state to look for (default: New).
+            
+        Returns:
+            List of task IDs.
+        """
+        query = (
+            "SELECT [System.Id] FROM WorkItems "
+            f"WHERE [System.WorkItemType] = '{_wiql_string(work_item_type)}' "
+            f"AND [System.State] = '{_wiql_string(state)}'"
+        )
+        if self.azure_client.project:
+            query += f" AND [System.TeamProject] = '{_wiql_string(self.azure_client.project)}'"
+        
+        work_item_ids = await asyncio.to_thread(self.azure_client.query_work_item_ids, query)
+        return [str(work_item_id) for work_item_id in work_item_ids]
+    
+    async def process_task(self, task_id: str) -> Dict[str, Any]:
         """
         Process an Azure DevOps task by its ID.
         
         This is the main entry point for task processing. It orchestrates the entire workflow,
-        from retrieving task details to creating a pull request.
+        from retrieving task details to creating a pull request. Blocking Azure DevOps
+        and Git calls are run in worker threads so several tasks can be in flight
+        on one event loop.
         
         Args:
             task_id: ID of the task to process.
@@ -94,13 +162,75 @@ class Orchestrator:
             Dictionary with processing results.
         """
         # Start tracking time for metrics
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
-        logger.info(f"Starting to process task {task_id}")
+        logger.info("Starting to process task %s", task_id)
         
         try:
             # Step 1: Process task details
-            task_result = self.task_processor.process_task(task_id)
+            task_result = await asyncio.to_thread(self.task_processor.process_task, task_id)
+        except Exception as e:
+            return self._task_error(task_id, e, start_time)
+        
+        return await self._complete_task(task_id, task_result, start_time)
+    
+    async def process_tasks(self, 
+                            task_ids: List[str], 
+                            max_concurrency: int = 1) -> List[Dict[str, Any]]:
+        """
+        Process several Azure DevOps tasks.
+        
+        The tasks' work items are retrieved in one batch by the task processor,
+        then the remaining workflow runs for up to max_concurrency tasks at a time.
+        
+        Args:
+            task_ids: IDs of the tasks to process.
+            max_concurrency: Maximum number of tasks processed at the same time.
+            
+        Returns:
+            List of processing result dictionaries, in the order of the given IDs.
+        """
+        start_time = time.perf_counter()
+        
+        logger.info("Starting to process %d tasks", len(task_ids))
+        
+        # Step 1: Process task details
+        task_results = await self.task_processor.process_tasks(task_ids, max_concurrency)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def complete(task_id: str, task_result: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._complete_task(task_id, task_result, start_time)
+        
+        return await asyncio.gather(*(
+            complete(task_id, task_result) for task_id, task_result in zip(task_ids, task_results)
+        ))
+    
+    async def _complete_task(self, 
+                             task_id: str, 
+                             task_result: Dict[str, Any], 
+                             start_time: float) -> Dict[str, Any]:
+        """
+        Run the workflow after task details were processed, up to the pull request.
+        
+        Args:
+            task_id: ID of the task.
+            task_result: Result of TaskProcessor.process_task.
+            start_time: perf_counter value when processing of the task started.
+            
+        Returns:
+            Dictionary with processing results.
+        """
+        try:
+            # Task details could not be processed (already logged)
+            if task_result.get('status') == 'error':
+                return {
+                    'status': 'error',
+                    'message': f"Error processing task: {task_result.get('message', 'Unknown error')}",
+                    'task_id': task_id,
+                    'processing_time': f"{time.perf_counter() - start_time:.3f}s"
+                }
             
             # Check if task needs clarification
             if task_result.get('status') == 'clarification_requested':
@@ -108,7 +238,7 @@ class Orchestrator:
                     'status': 'clarification_requested',
                     'message': "Clarification requested for this task. Please check the task comments.",
                     'task_id': task_id,
-                    'processing_time': str(datetime.now() - start_time)
+                    'processing_time': f"{time.perf_counter() - start_time:.3f}s"
                 }
             
             # Step 2: Clone and set up repository
@@ -120,37 +250,37 @@ class Orchestrator:
                     'status': 'error',
                     'message': "Repository URL not found in task details.",
                     'task_id': task_id,
-                    'processing_time': str(datetime.now() - start_time)
+                    'processing_time': f"{time.perf_counter() - start_time:.3f}s"
                 }
                 
-            git_handler = self._setup_repository(repo_url, task_id)
+            git_handler = await self._setup_repository(repo_url, task_id)
             
             if not git_handler:
                 return {
                     'status': 'error',
                     'message': "Failed to set up repository.",
                     'task_id': task_id,
-                    'processing_time': str(datetime.now() - start_time)
+                    'processing_time': f"{time.perf_counter() - start_time:.3f}s"
                 }
             
             # Step 3: Implement changes
             repo_path = git_handler.local_path
-            implementation_manager = ImplementationManager(repo_path)
+            implementation_manager = ImplementationManager(repo_path, self.code_generator)
             
-            implementation_result = implementation_manager.implement_task(task_result)
+            implementation_result = await implementation_manager.implement_task_async(task_result)
             
             # Step 4: Commit changes
-            commit_hash = implementation_manager.commit_changes(task_id)
+            commit_hash = await asyncio.to_thread(implementation_manager.commit_changes, task_id)
             
             # Step 5: Create pull request
-            self.pr_manager = PRManager(self.azure_client, git_handler)
+            pr_manager = self.pr_manager.with_git_handler(git_handler)
             
             # Get repository ID
             repository_id = self._get_repository_id(repo_info)
             
             # Create PR
             branch_name = f"task/{task_id}"
-            pr_result = self.pr_manager.create_pull_request(
+            pr_result = await pr_manager.create_pull_request_async(
                 task_id=task_id,
                 task_details=task_result.get('task_details', {}),
                 implementation_results=implementation_result,
@@ -161,7 +291,7 @@ class Orchestrator:
             )
             
             # Calculate processing time
-            processing_time = datetime.now() - start_time
+            processing_time = f"{time.perf_counter() - start_time:.3f}s"
             
             # Return final result
             return {
@@ -170,20 +300,35 @@ class Orchestrator:
                 'implementation_result': implementation_result,
                 'commit_hash': commit_hash,
                 'pull_request': pr_result,
-                'processing_time': str(processing_time)
+                'processing_time': processing_time
             }
             
         except Exception as e:
-            logger.error(f"Error processing task {task_id}: {str(e)}", exc_info=True)
+            return self._task_error(task_id, e, start_time)
+    
+    @staticmethod
+    def _task_error(task_id: str, error: Exception, start_time: float) -> Dict[str, Any]:
+        """
+        Log and build the result for a task that failed with an exception.
+        
+        Args:
+            task_id: ID of the task.
+            error: The exception raised.
+            start_time: perf_counter value when processing of the task started.
             
-            return {
-                'status': 'error',
-                'message': f"Error processing task: {str(e)}",
-                'task_id': task_id,
-                'processing_time': str(datetime.now() - start_time)
-            }
+        Returns:
+            Dictionary with processing results.
+        """
+        logger.error("Error processing task %s: %s", task_id, error, exc_info=True)
+        
+        return {
+            'status': 'error',
+            'message': f"Error processing task: {str(error)}",
+            'task_id': task_id,
+            'processing_time': f"{time.perf_counter() - start_time:.3f}s"
+        }
     
-    def _setup_repository(self, repo_url: str, task_id: str) -> Optional[GitHandler]:
+    async def _setup_repository(self, repo_url: str, task_id: str) -> Optional[GitHandler]:
         """
         Set up a repository for a task.
         
@@ -195,9 +340,14 @@ class Orchestrator:
             GitHandler instance or None if setup failed.
         """
         try:
-            # Create directory for this task's repository
+            # Directory for this task's repository; git clone creates it
             repo_dir = os.path.join(self.work_dir, f"task_{task_id}")
-            os.makedirs(repo_dir, exist_ok=True)
+            
+            # Remove what an earlier, failed attempt at this task left behind,
+            # otherwise the clone fails and the task can never succeed
+            if os.path.lexists(repo_dir):
+                logger.info("Removing stale repository directory %s", repo_dir)
+                await asyncio.to_thread(shutil.rmtree, repo_dir)
             
             # Initialize Git handler
             git_handler = GitHandler(
@@ -205,18 +355,24 @@ class Orchestrator:
                 local_path=repo_dir
             )
             
-            # Clone repository
-            git_handler.clone_repository()
+            # Shallow, blob-less clone of the default branch; missing blobs are
+            # fetched on demand by git
+            await asyncio.to_thread(
+                git_handler.clone_repository,
+                depth=1,
+                blob_filter='blob:none',
+                single_branch=True
+            )
             
             # Create a new branch for the task
             branch_name = f"task/{task_id}"
-            git_handler.create_branch(branch_name)
+            await asyncio.to_thread(git_handler.create_branch, branch_name)
             
-            logger.info(f"Repository set up successfully at {repo_dir}")
+            logger.info("Repository set up successfully at %s", repo_dir)
             return git_handler
             
         except Exception as e:
-            logger.error(f"Failed to set up repository: {str(e)}")
+            logger.error("Failed to set up repository: %s", e)
             return None
     
     def _get_repository_id(self, repo_info: Dict[str, Any]) -> str:
@@ -238,7 +394,7 @@ class Orchestrator:
         
         # Pattern: https://dev.azure.com/{org}/{project}/_git/{repo}
         # or: https://{org}.visualstudio.com/{project}/_git/{repo}
-        match = re.search(r'/_git/([^/]+)$', url)
+        match = _GIT_ID_RE.search(url)
         if match:
             return match.group(1)
             
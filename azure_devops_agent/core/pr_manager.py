@@ -6,22 +6,62 @@ including formatting PR descriptions and handling reviewers.
 """
 
 import os
+import asyncio
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from azure_devops_agent.core.azure_client import AzureDevOpsClient
-from azure_devops_agent.repository.git_handler import GitHandler
+
+# GitHandler is only needed for type hints; instances are passed in by callers
+if TYPE_CHECKING:
+    from azure_devops_agent.repository.git_handler import GitHandler
 
 logger = logging.getLogger(__name__)
 
+# Reviewer values that are already identity IDs
+_GUID_RE = re.compile(r'^[0-9a-fA-F-]{36}$')
+
+# Maximum number of concurrent identity lookups
+MAX_IDENTITY_LOOKUPS = 8
+
+# Maximum number of PRs created concurrently, to stay within API rate limits
+MAX_CONCURRENT_PRS = 5
+
+# Azure DevOps limit on PR title length
+MAX_PR_TITLE_LENGTH = 255
+
+# Maximum length of the task description quoted in the PR summary
+MAX_BRIEF_DESCRIPTION_LENGTH = 500
+
+# Fixed sections of the PR description
+_PR_HEADER = "\n## Summary\n"
+_PR_CHANGES = "\n\n## Implemented Changes\n"
+_PR_TESTING = "\n\n## Testing\n"
+_PR_REFERENCE_HEADER = "\n\n## Task Reference\nThis PR addresses Azure DevOps Task #"
+_PR_FOOTER = "\n\n_This pull request was created by an AI Agent_\n"
+
+# Header of the performance comparison table
+_PERF_TABLE_HEADER = (
+    "| Metric | Before | After | Change |\n"
+    "|--------|--------|-------|--------|"
+)
+
+# How long reviewer lookups are cached, in seconds
+REVIEWER_CACHE_TTL = 300
+
 class PRManager:
     """Manage pull requests in Azure DevOps."""
     
+    __slots__ = ('azure_client', 'git_handler', '_reviewer_cache', '_identity_cache')
+    
     def __init__(self, 
                  azure_client: AzureDevOpsClient,
-                 git_handler: Optional[GitHandler] = None):
+                 git_handler: Optional['GitHandler'] = None):
         """
         Initialize the PR manager.
         
@@ -31,8 +71,32 @@ class PRManager:
         """
         self.azure_client = azure_client
         self.git_handler = git_handler
+        # (project, repository_id) -> (fetch time, reviewers)
+        self._reviewer_cache: Dict[Tuple[Optional[str], str], Tuple[float, Tuple[Dict[str, Any], ...]]] = {}
+        # Email/display name -> identity ID
+        self._identity_cache: Dict[str, str] = {}
         logger.info("PR manager initialized")
     
+    def with_git_handler(self, git_handler: 'GitHandler') -> 'PRManager':
+        """
+        Return a PR manager for another repository that shares this one's caches.
+        
+        Reviewer and identity lookups then stay cached across tasks, while
+        each task pushes through its own Git handler.
+        
+        Args:
+            git_handler: GitHandler of the repository to push from.
+            
+        Returns:
+            New PRManager instance.
+        """
+        pr_manager = PRManager.__new__(PRManager)
+        pr_manager.azure_client = self.azure_client
+        pr_manager.git_handler = git_handler
+        pr_manager._reviewer_cache = self._reviewer_cache
+        pr_manager._identity_cache = self._identity_cache
+        return pr_manager
+    
     def create_pull_request(self, 
                           task_id: str,
                           task_details: Dict[str, Any],
@@ -59,19 +123,12 @@ class PRManager:
             Dictionary with created PR details.
         """
         # Ensure branch changes are pushed
-        if self.git_handler:
-            logger.info(f"Ensuring changes are pushed to {source_branch}")
-            try:
-                self.git_handler.push_changes(source_branch, set_upstream=True)
-            except Exception as e:
-                logger.error(f"Failed to push changes: {str(e)}")
-                return {
-                    'status': 'error',
-                    'message': f"Failed to push changes: {str(e)}"
-                }
+        push_error = self._push_branch(source_branch)
+        if push_error:
+            return push_error
         
         # Create PR title
-        title = self._create_pr_title(task_id, task_details)
+        title = self._create_pr_title(task_id, task_details.get('title', 'Implement task'))
         
         # Create PR description
         description = self._create_pr_description(
@@ -80,9 +137,126 @@ class PRManager:
             implementation_results
         )
         
+        return self._submit_pull_request(
+            task_id, title, description, repository_id,
+            source_branch, target_branch, project, reviewers
+        )
+    
+    async def create_pull_request_async(self, 
+                                      task_id: str,
+                                      task_details: Dict[str, Any],
+                                      implementation_results: Dict[str, Any],
+                                      repository_id: str,
+                                      source_branch: str,
+                                      target_branch: str = 'main',
+                                      project: Optional[str] = None,
+                                      reviewers: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Create a pull request for a completed task without blocking the event loop.
+        
+        The branch is pushed in a worker thread while the PR title and
+        description are built, then the PR is created once the push completes.
+        Takes the same arguments as create_pull_request.
+        
+        Returns:
+            Dictionary with created PR details.
+        """
+        push_task = asyncio.create_task(asyncio.to_thread(self._push_branch, source_branch))
+        
+        title = self._create_pr_title(task_id, task_details.get('title', 'Implement task'))
+        description = self._create_pr_description(
+            task_id,
+            task_details,
+            implementation_results
+        )
+        
+        push_error = await push_task
+        if push_error:
+            return push_error
+        
+        return await asyncio.to_thread(
+            self._submit_pull_request,
+            task_id, title, description, repository_id,
+            source_branch, target_branch, project, reviewers
+        )
+    
+    async def create_pull_requests_async(self, 
+                                       pr_requests: List[Dict[str, Any]],
+                                       max_concurrency: int = MAX_CONCURRENT_PRS) -> List[Dict[str, Any]]:
+        """
+        Create several pull requests concurrently.
+        
+        Args:
+            pr_requests: Keyword arguments for create_pull_request_async, one dict per PR.
+            max_concurrency: Maximum number of PRs created at the same time.
+            
+        Returns:
+            List of PR result dictionaries, in the order of the requests.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def create(pr_request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_pull_request_async(**pr_request)
+        
+        return await asyncio.gather(*(create(pr_request) for pr_request in pr_requests))
+    
+    def _push_branch(self, source_branch: str) -> Optional[Dict[str, Any]]:
+        """
+        Push the source branch, if a Git handler is available.
+        
+        Args:
+            source_branch: Branch to push.
+            
+        Returns:
+            Error result dictionary if the push failed, otherwise None.
+        """
+        if not self.git_handler:
+            return None
+        
+        logger.info("Ensuring changes are pushed to %s", source_branch)
         try:
+            self.git_handler.push_changes(source_branch, set_upstream=True)
+        except Exception as e:
+            logger.error("Failed to push changes: %s", e)
+            return {
+                'status': 'error',
+                'message': f"Failed to push changes: {str(e)}"
+            }
+        
+        return None
+    
+    def _submit_pull_request(self, 
+                           task_id: str,
+                           title: str,
+                           description: str,
+                           repository_id: str,
+                           source_branch: str,
+                           target_branch: str,
+                           project: Optional[str],
+                           reviewers: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Create the pull request in Azure DevOps.
+        
+        Args:
+            task_id: ID of the task.
+            title: PR title.
+            description: PR description.
+            repository_id: ID or name of the repository.
+            source_branch: Source branch name.
+            target_branch: Target branch name.
+            project: Project name (default: from Azure client).
+            reviewers: List of reviewer IDs, emails or display names.
+            
+        Returns:
+            Dictionary with created PR details.
+        """
+        try:
+            # Resolve reviewer emails/names to identity IDs up front
+            reviewers, unresolved_reviewers = self._resolve_reviewers(reviewers)
+            
             # Create the PR in Azure DevOps
-            logger.info(f"Creating PR for task {task_id} from {source_branch} to {target_branch}")
+            logger.info("Creating PR for task %s from %s to %s", task_id, source_branch, target_branch)
             pr = self.azure_client.create_pull_request(
                 repository_id=repository_id,
                 project=project,
@@ -94,44 +268,92 @@ class PRManager:
                 work_item_ids=[int(task_id)]
             )
             
-            logger.info(f"PR created successfully: ID {pr.pull_request_id}")
+            logger.info("PR created successfully: ID %s", pr.pull_request_id)
             return {
                 'status': 'success',
                 'pr_id': pr.pull_request_id,
                 'pr_url': pr.url,
-                'title': title
+                'title': title,
+                'unresolved_reviewers': unresolved_reviewers
             }
             
         except Exception as e:
-            logger.error(f"Failed to create PR: {str(e)}")
+            logger.error("Failed to create PR: %s", e)
             return {
                 'status': 'error',
                 'message': f"Failed to create PR: {str(e)}"
             }
     
-    def _create_pr_title(self, task_id: str, task_details: Dict[str, Any]) -> str:
+    def _resolve_reviewers(self, reviewers: Optional[List[str]]) -> Tuple[Optional[List[str]], List[str]]:
+        """
+        Resolve reviewer emails or display names to identity IDs.
+        
+        Values that already look like identity IDs are kept as they are. The
+        remaining values are looked up concurrently and cached, so each name is
+        only resolved once per PR manager (and the managers sharing its caches).
+        
+        Args:
+            reviewers: List of reviewer IDs, emails or display names.
+            
+        Returns:
+            Tuple of (list of reviewer identity IDs, list of reviewers that
+            could not be resolved and are left off the PR).
+        """
+        if not reviewers:
+            return reviewers, []
+        
+        unresolved = list(dict.fromkeys(
+            r for r in reviewers if not _GUID_RE.match(r) and r not in self._identity_cache
+        ))
+        
+        if unresolved:
+            def lookup(name: str) -> Optional[str]:
+                try:
+                    return self.azure_client.get_identity_id(name)
+                except Exception as e:
+                    logger.warning("Failed to look up reviewer %s: %s", name, e)
+                    return None
+            
+            with ThreadPoolExecutor(max_workers=min(MAX_IDENTITY_LOOKUPS, len(unresolved))) as executor:
+                for name, identity_id in zip(unresolved, executor.map(lookup, unresolved)):
+                    if identity_id:
+                        self._identity_cache[name] = identity_id
+            
+            unresolved = [name for name in unresolved if name not in self._identity_cache]
+            for name in unresolved:
+                logger.warning("No identity found for reviewer %s; leaving them off the PR", name)
+        
+        resolved = [
+            r if _GUID_RE.match(r) else self._identity_cache[r]
+            for r in reviewers
+            if _GUID_RE.match(r) or r in self._identity_cache
+        ]
+        return resolved, unresolved
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _create_pr_title(task_id: str, task_title: str) -> str:
         """
         Create a PR title following the specified format.
         
         Args:
             task_id: ID of the task.
-            task_details: Details of the task.
+            task_title: Title of the task.
             
         Returns:
             Formatted PR title.
         """
-        # Get task title or use a default
-        task_title = task_details.get('title', 'Implement task')
-        
         # Format according to spec: [Task #{task_number}] {Brief description} (AI Agent)
-        title = f"[Task #{task_id}] {task_title} (AI Agent)"
+        prefix = f"[Task #{task_id}] "
+        suffix = " (AI Agent)"
         
-        # Ensure title is not too long (Azure DevOps has a limit)
-        max_length = 255
-        if len(title) > max_length:
-            title = title[:max_length-3] + "..."
+        # Ensure title is not too long (Azure DevOps has a limit), truncating
+        # only the task title so the full title is never built oversized
+        budget = MAX_PR_TITLE_LENGTH - len(prefix) - len(suffix)
+        if len(task_title) > budget:
+            task_title = task_title[:budget-3] + "..."
             
-        return title
+        return prefix + task_title + suffix
     
     def _create_pr_description(self, 
                              task_id: str, 
@@ -150,43 +372,32 @@ class PRManager:
         """
         # Get implementation summary
         implementations = implementation_results.get('implementations', [])
-        modified_files = [i['file'] for i in implementations if i['status'] == 'success']
         
-        # Get test summary
+        # Get test summary in a single pass
         tests = implementation_results.get('tests', [])
-        test_files = [t['file'] for t in tests if t['status'] in ['success', 'generated']]
-        
-        # Format description according to spec
-        description = """
-## Summary
-{brief_description}
-
-## Implemented Changes
-{changes}
-
-## Testing
-{testing}
-
-## Task Reference
-This PR addresses Azure DevOps Task #{task_id}
-
-_This pull request was created by an AI Agent_
-"""
+        test_files = []
+        total_run = 0
+        total_passed = 0
+        saw_tests_run = False
+        for t in tests:
+            if t['status'] in ('success', 'generated'):
+                test_files.append(t['file'])
+            if 'tests_run' in t:
+                saw_tests_run = True
+                total_run += t['tests_run']
+                total_passed += t.get('tests_passed', 0)
         
         # Extract brief description from task details
         brief_description = task_details.get('description', 'No description provided')
-        if len(brief_description) > 500:
-            brief_description = brief_description[:497] + "..."
+        if len(brief_description) > MAX_BRIEF_DESCRIPTION_LENGTH:
+            brief_description = brief_description[:MAX_BRIEF_DESCRIPTION_LENGTH-3] + "..."
             
         # Create changes list
-        changes_list = []
-        for implementation in implementations:
-            file_path = implementation['file']
-            action = implementation['action']
-            language = implementation.get('language', '')
-            
-            changes_list.append(f"- **{action.capitalize()}** `{file_path}` ({language})")
-            
+        changes_list = [
+            f"- **{i['action'].capitalize()}** `{i['file']}` ({i.get('language', '')})"
+            for i in implementations
+        ]
+        
         changes = "\n".join(changes_list) if changes_list else "- No changes implemented"
         
         # Create testing summary
@@ -197,10 +408,7 @@ _This pull request was created by an AI Agent_
                 testing_list.append(f"  - `{test_file}`")
                 
             # Add test results if available
-            if any('tests_run' in t for t in tests):
-                total_run = sum(t.get('tests_run', 0) for t in tests)
-                total_passed = sum(t.get('tests_passed', 0) for t in tests)
-                
+            if saw_tests_run:
                 if total_run > 0:
                     testing_list.append(f"- Ran {total_run} tests, {total_passed} passed")
         else:
@@ -208,15 +416,14 @@ _This pull request was created by an AI Agent_
             
         testing = "\n".join(testing_list)
         
-        # Format the final description
-        formatted_description = description.format(
-            brief_description=brief_description,
-            changes=changes,
-            testing=testing,
-            task_id=task_id
+        # Format description according to spec; a single f-string compiles to
+        # one string build, which benchmarks faster than StringIO or string.Template
+        return (
+            f"{_PR_HEADER}{brief_description}"
+            f"{_PR_CHANGES}{changes}"
+            f"{_PR_TESTING}{testing}"
+            f"{_PR_REFERENCE_HEADER}{task_id}{_PR_FOOTER}"
         )
-        
-        return formatted_description
     
     def get_reviewers_for_repository(self, 
                                    repository_id: str, 
@@ -231,16 +438,26 @@ _This pull request was created by an AI Agent_
         Returns:
             List of potential reviewers.
         """
+        key = (project or self.azure_client.project, repository_id)
+        
+        # Serve repeated lookups for the same repository from the cache
+        cached = self._reviewer_cache.get(key)
+        if cached and time.monotonic() - cached[0] < REVIEWER_CACHE_TTL:
+            return [dict(reviewer) for reviewer in cached[1]]
+        
         # In a real implementation, this would use the Azure DevOps API to get
         # repository contributors or code owners
         # For now, this returns a placeholder
-        logger.info(f"Getting reviewers for repository {repository_id}")
+        logger.info("Getting reviewers for repository %s", repository_id)
         
-        # Return placeholder reviewers
-        return [
+        # Placeholder reviewers
+        reviewers = (
             {'id': 'placeholder-id-1', 'displayName': 'Placeholder Reviewer 1'},
             {'id': 'placeholder-id-2', 'displayName': 'Placeholder Reviewer 2'}
-        ]
+        )
+        
+        self._reviewer_cache[key] = (time.monotonic(), reviewers)
+        return [dict(reviewer) for reviewer in reviewers]
     
     def format_pr_for_cross_repository_dependencies(self, 
                                                  description: str,
@@ -259,25 +476,24 @@ _This pull request was created by an AI Agent_
             return description
             
         # Create dependencies section
-        dependencies_section = "\n## Cross-Repository Dependencies\n"
+        parts = ["\n## Cross-Repository Dependencies\n"]
         
         for dep in dependencies:
             repo_name = dep.get('name', 'Unknown repository')
             repo_url = dep.get('url', '#')
             dep_type = dep.get('type', 'dependency')
             
-            dependencies_section += f"- **{repo_name}** ({dep_type})\n"
-            dependencies_section += f"  - {repo_url}\n"
+            parts.append(f"- **{repo_name}** ({dep_type})\n")
+            parts.append(f"  - {repo_url}\n")
             
-            if 'changes_needed' in dep and dep['changes_needed']:
-                dependencies_section += "  - Changes required:\n"
-                for change in dep['changes_needed']:
-                    dependencies_section += f"    - {change}\n"
+            changes_needed = dep.get('changes_needed')
+            if changes_needed:
+                parts.append("  - Changes required:\n")
+                for change in changes_needed:
+                    parts.append(f"    - {change}\n")
                     
         # Add to the original description
-        updated_description = description + "\n" + dependencies_section
-        
-        return updated_description
+        return f"{description}\n{''.join(parts)}"
     
     def format_pr_for_performance_optimization(self, 
                                             description: str,
@@ -294,33 +510,37 @@ _This pull request was created by an AI Agent_
         Returns:
             Updated PR description with performance comparison.
         """
+        # Nothing to compare unless both sides have metrics; this also covers
+        # tasks with no performance metadata at all
         if not before_metrics or not after_metrics:
             return description
             
+        # Split metrics once into those with numeric values on both sides and the rest
+        numeric_metrics = (
+            {metric for metric, value in before_metrics.items() if isinstance(value, (int, float))}
+            & {metric for metric, value in after_metrics.items() if isinstance(value, (int, float))}
+        )
+        other_metrics = (before_metrics.keys() | after_metrics.keys()) - numeric_metrics
+        
         # Create performance section
-        perf_section = "\n## Performance Comparison\n"
-        perf_section += "| Metric | Before | After | Change |\n"
-        perf_section += "|--------|--------|-------|--------|\n"
+        rows = ["", "## Performance Comparison", _PERF_TABLE_HEADER]
         
-        for metric in set(list(before_metrics.keys()) + list(after_metrics.keys())):
-            before_value = before_metrics.get(metric, 'N/A')
-            after_value = after_metrics.get(metric, 'N/A')
-            
-            # Calculate change if both values are numeric
-            change = 'N/A'
-            if isinstance(before_value, (int, float)) and isinstance(after_value, (int, float)):
-                if before_value != 0:
-                    percent_change = ((after_value - before_value) / before_value) * 100
-                    change = f"{percent_change:.2f}%"
-                else:
-                    change = 'N/A (division by zero)'
-                    
-            perf_section += f"| {metric} | {before_value} | {after_value} | {change} |\n"
+        for metric in numeric_metrics:
+            before_value = before_metrics[metric]
+            after_value = after_metrics[metric]
+            if before_value != 0:
+                change = f"{(after_value - before_value) / before_value * 100:.2f}%"
+            else:
+                change = 'N/A (division by zero)'
+            rows.append(f"| {metric} | {before_value} | {after_value} | {change} |")
+        
+        for metric in other_metrics:
+            rows.append(
+                f"| {metric} | {before_metrics.get(metric, 'N/A')} | {after_metrics.get(metric, 'N/A')} | N/A |"
+            )
             
         # Add to the original description
-        updated_description = description + "\n" + perf_section
-        
-        return updated_description
+        return f"{description}\n" + "\n".join(rows) + "\n"
     
     def format_pr_for_feature_flag(self, 
                                  description: str,
@@ -339,46 +559,46 @@ _This pull request was created by an AI Agent_
             return description
             
         # Create feature flag section
-        flag_section = "\n## Feature Flag Information\n"
+        parts = ["\n## Feature Flag Information\n"]
         
         flag_name = feature_flag.get('name', 'Unknown')
-        flag_section += f"### Flag Name: `{flag_name}`\n\n"
+        parts.append(f"### Flag Name: `{flag_name}`\n\n")
         
         # Default state
         default_state = feature_flag.get('default_state', 'disabled')
-        flag_section += f"Default state: **{default_state}**\n\n"
+        parts.append(f"Default state: **{default_state}**\n\n")
         
         # Configuration
-        flag_section += "### Configuration\n"
+        parts.append("### Configuration\n")
         
-        if 'configuration' in feature_flag:
-            for env, config in feature_flag['configuration'].items():
-                flag_section += f"#### {env} Environment\n"
-                flag_section += f"- State: {config.get('state', 'not specified')}\n"
+        # Skip the loop entirely for flags without per-environment configuration
+        configuration = feature_flag.get('configuration')
+        if configuration:
+            for env, config in configuration.items():
+                parts.append(f"#### {env} Environment\n")
+                parts.append(f"- State: {config.get('state', 'not specified')}\n")
                 
                 if 'variables' in config:
-                    flag_section += "- Variables:\n"
+                    parts.append("- Variables:\n")
                     for key, value in config['variables'].items():
-                        flag_section += f"  - `{key}`: `{value}`\n"
+                        parts.append(f"  - `{key}`: `{value}`\n")
                         
         # Usage information
-        flag_section += "\n### Usage Instructions\n"
+        parts.append("\n### Usage Instructions\n")
         
         if 'usage' in feature_flag:
-            flag_section += feature_flag['usage']
+            parts.append(feature_flag['usage'])
         else:
-            flag_section += f"To enable the feature, set the `{flag_name}` flag to `true` in your configuration.\n"
+            parts.append(f"To enable the feature, set the `{flag_name}` flag to `true` in your configuration.\n")
             
         # Testing instructions
-        flag_section += "\n### Testing\n"
+        parts.append("\n### Testing\n")
         
         if 'testing' in feature_flag:
-            flag_section += feature_flag['testing']
+            parts.append(feature_flag['testing'])
         else:
-            flag_section += "- Test with the feature flag both enabled and disabled\n"
-            flag_section += f"- To enable for testing, set `{flag_name}=true`\n"
+            parts.append("- Test with the feature flag both enabled and disabled\n")
+            parts.append(f"- To enable for testing, set `{flag_name}=true`\n")
             
         # Add to the original description
-        updated_description = description + "\n" + flag_section
-        
-        return updated_description
\ No newline at end of file
+        return f"{description}\n{''.join(parts)}"
\ No newline at end of file
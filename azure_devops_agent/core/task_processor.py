@@ -5,18 +5,40 @@ This module handles the processing of Azure DevOps tasks, including
 interpreting task details and orchestrating the implementation workflow.
 """
 
+import asyncio
 import logging
 import re
 from typing import Dict, Any, List, Optional, Tuple
 
+# google-re2 guarantees linear-time matching on long task descriptions;
+# fall back to the standard library engine when it is not installed
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 from azure_devops_agent.core.azure_client import AzureDevOpsClient
-from azure_devops_agent.repository.git_handler import GitHandler
 
 logger = logging.getLogger(__name__)
 
+# File paths mentioned in a task: either after a keyword such as "modify" or
+# "file:", or any bare path with a short alphabetic extension
+_FILE_RE = _regex.compile(
+    r'(?:(?:in|modify|update|create|the file|file)[:\s]+`?([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)`?)'
+    r'|(?:([a-zA-Z0-9_\-./\\]+\.[a-zA-Z]{1,5})\b)'
+)
+
+# Maximum number of tasks processed concurrently, to stay within API rate limits
+MAX_CONCURRENT_TASKS = 8
+
+# Descriptions shorter than this are considered too vague to implement
+MIN_DESCRIPTION_LENGTH = 50
+
 class TaskProcessor:
     """Process and orchestrate Azure DevOps tasks."""
     
+    __slots__ = ('azure_client',)
+    
     def __init__(self, azure_client: AzureDevOpsClient):
         """
         Initialize the task processor.
@@ -26,7 +48,7 @@ class TaskProcessor:
         """
         self.azure_client = azure_client
         
-    def process_task(self, work_item_id: int) -> Dict[str, Any]:
+    def process_task(self, work_item_id: int, work_item: Optional[Any] = None) -> Dict[str, Any]:
         """
         Process an Azure DevOps task by its ID.
         
@@ -35,21 +57,20 @@ class TaskProcessor:
         
         Args:
             work_item_id: The ID of the task to process.
+            work_item: Already retrieved work item (optional).
             
         Returns:
             Dictionary with processing result details.
         """
-        logger.info(f"Starting to process task {work_item_id}")
+        logger.info("Starting to process task %s", work_item_id)
         
         # Get task details
-        work_item = self.azure_client.get_work_item(work_item_id)
+        if work_item is None:
+            work_item = self.azure_client.get_work_item(work_item_id)
         task_details = self.azure_client.extract_task_details(work_item)
         
-        # Analyze task requirements
-        requirements = self._analyze_requirements(task_details)
-        
-        # Check if task needs clarification
-        missing_info = self._check_for_missing_information(task_details, requirements)
+        # Analyze task requirements and check if task needs clarification
+        requirements, missing_info = self._analyze_and_validate(task_details)
         if missing_info:
             self._request_clarification(work_item_id, missing_info)
             return {
@@ -70,12 +91,56 @@ class TaskProcessor:
             'repository': repository_info
         }
         
-        logger.info(f"Task {work_item_id} processed successfully")
+        logger.info("Task %s processed successfully", work_item_id)
         return result
     
-    def _analyze_requirements(self, task_details: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_tasks(self, 
+                            work_item_ids: List[int], 
+                            concurrency: int = MAX_CONCURRENT_TASKS) -> List[Dict[str, Any]]:
         """
-        Analyze the task details to extract requirements.
+        Process several Azure DevOps tasks concurrently.
+        
+        When more than one task is pending, the work items are retrieved with a
+        single batched request instead of one request per task. The Azure DevOps
+        client is synchronous, so each task is then processed in a worker
+        thread; a semaphore bounds how many are in flight.
+        
+        Args:
+            work_item_ids: The IDs of the tasks to process.
+            concurrency: Maximum number of tasks processed at the same time.
+            
+        Returns:
+            List of processing result dictionaries, in the order of the given IDs.
+            A task that fails gets an 'error' result without affecting the others.
+        """
+        work_items = {}
+        if len(work_item_ids) > 1:
+            try:
+                work_items = await asyncio.to_thread(self.azure_client.get_work_items_batch, work_item_ids)
+            except Exception as e:
+                logger.warning("Failed to retrieve work items in a batch, retrieving them one by one: %s", e)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def process(work_item_id: int) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self.process_task, work_item_id, work_items.get(int(work_item_id))
+                    )
+                except Exception as e:
+                    logger.error("Failed to process task %s: %s", work_item_id, e)
+                    return {
+                        'status': 'error',
+                        'message': str(e),
+                        'task_id': work_item_id
+                    }
+        
+        return await asyncio.gather(*(process(work_item_id) for work_item_id in work_item_ids))
+    
+    def _analyze_and_validate(self, task_details: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Analyze the task details and check for missing information in one pass.
         
         This method parses the task description and acceptance criteria to identify:
         - What files need to be modified
@@ -83,55 +148,21 @@ class TaskProcessor:
         - Testing requirements
         - Documentation requirements
         
+        It also collects any missing information that requires clarification. When
+        the description is too brief the task cannot be implemented anyway, so the
+        file path scan is skipped.
+        
         Args:
             task_details: Task details dictionary.
             
         Returns:
-            Dictionary containing parsed requirements.
+            Tuple of the parsed requirements dictionary and the list of missing
+            information items (empty if all required info is present).
         """
         description = task_details.get('description', '')
         acceptance_criteria = task_details.get('acceptance_criteria', '')
+        description_length = len(description)
         
-        # Combine description and acceptance criteria for analysis
-        text_to_analyze = f"{description}\n{acceptance_criteria}"
-        
-        # Extract potential file paths mentioned in the task
-        file_patterns = [
-            r'(?:in|modify|update|create|the file|file)[:\s]+`?([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)`?',
-            r'([a-zA-Z0-9_\-./\\]+\.[a-zA-Z]{1,5})\b(?:\s+file)?'
-        ]
-        
-        files_to_modify = []
-        for pattern in file_patterns:
-            matches = re.findall(pattern, text_to_analyze)
-            files_to_modify.extend(matches)
-        
-        # Extract testing requirements
-        testing_required = 'test' in text_to_analyze.lower()
-        
-        # Basic requirements extraction
-        requirements = {
-            'files_to_modify': list(set(files_to_modify)),  # Remove duplicates
-            'testing_required': testing_required,
-            'description_summary': description[:500] + '...' if len(description) > 500 else description,
-        }
-        
-        logger.info(f"Analyzed requirements: {len(requirements['files_to_modify'])} files identified")
-        return requirements
-    
-    def _check_for_missing_information(self, 
-                                     task_details: Dict[str, Any], 
-                                     requirements: Dict[str, Any]) -> List[str]:
-        """
-        Check if there is missing information that requires clarification.
-        
-        Args:
-            task_details: Task details dictionary.
-            requirements: Parsed requirements dictionary.
-            
-        Returns:
-            List of missing information items, empty if all required info is present.
-        """
         missing_info = []
         
         # Check for repository information
@@ -139,16 +170,38 @@ class TaskProcessor:
             missing_info.append("Repository information is missing. Please specify which repository should be modified.")
         
         # Check if task description is too vague
-        description = task_details.get('description', '')
-        if len(description) < 50:  # Very basic heuristic
+        description_too_brief = description_length < MIN_DESCRIPTION_LENGTH  # Very basic heuristic
+        if description_too_brief:
             missing_info.append("Task description is too brief. Please provide more details about what needs to be implemented.")
             
         # Check for acceptance criteria
-        if not task_details.get('acceptance_criteria'):
+        if not acceptance_criteria:
             missing_info.append("Acceptance criteria are missing. Please specify how to verify that the task is completed correctly.")
         
-        logger.info(f"Missing information check: {len(missing_info)} items missing")
-        return missing_info
+        # Combine description and acceptance criteria for analysis
+        text_to_analyze = f"{description}\n{acceptance_criteria}"
+        
+        # Extract potential file paths mentioned in the task (one pass, deduplicated)
+        # Every path match needs a '.' before its extension, so text without
+        # one is rejected by a C-level substring scan before the regex runs
+        if description_too_brief or '.' not in text_to_analyze:
+            files_to_modify = set()
+        else:
+            files_to_modify = {m[0] or m[1] for m in _FILE_RE.findall(text_to_analyze)}
+        
+        # Extract testing requirements
+        testing_required = 'test' in text_to_analyze.lower()
+        
+        # Basic requirements extraction
+        requirements = {
+            'files_to_modify': list(files_to_modify),
+            'testing_required': testing_required,
+            'description_summary': description[:500] + '...' if description_length > 500 else description,
+        }
+        
+        logger.info("Analyzed requirements: %d files identified", len(requirements['files_to_modify']))
+        logger.info("Missing information check: %d items missing", len(missing_info))
+        return requirements, missing_info
     
     def _request_clarification(self, work_item_id: int, missing_info: List[str]) -> None:
         """
@@ -164,7 +217,7 @@ class TaskProcessor:
         comment += "\nPlease provide this information so I can complete the task."
         
         self.azure_client.add_comment_to_work_item(work_item_id, comment)
-        logger.info(f"Requested clarification for task {work_item_id}")
+        logger.info("Requested clarification for task %s", work_item_id)
     
     def _determine_repository(self, task_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -209,7 +262,10 @@ class TaskProcessor:
             Dictionary with workflow execution results.
         """
         # This is just a skeleton and will be expanded
-        logger.info(f"Starting implementation workflow for task {task_id}")
+        logger.info("Starting implementation workflow for task %s", task_id)
+        
+        # Imported here so that plain task processing does not load GitPython
+        from azure_devops_agent.repository.git_handler import GitHandler
         
         # Initialize Git handler
         git_handler = GitHandler(repository_info['url'])
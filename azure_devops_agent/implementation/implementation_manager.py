@@ -6,22 +6,76 @@ code generation, and testing components.
 """
 
 import os
+import asyncio
+import copy
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import tempfile
+import threading
+from types import MappingProxyType
 
-from azure_devops_agent.implementation.language_detector import LanguageDetector
-from azure_devops_agent.implementation.code_generator import CodeGenerator
-from azure_devops_agent.repository.git_handler import GitHandler
+from azure_devops_agent.implementation.language_detector import LanguageDetector, is_skipped_dir
+
+# These are only needed for type hints; instances are created lazily
+if TYPE_CHECKING:
+    from azure_devops_agent.implementation.code_generator import CodeGenerator
+    from azure_devops_agent.repository.git_handler import GitHandler
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-in for a missing requirements dictionary
+_EMPTY = MappingProxyType({})
+
+# Maximum number of files implemented (or tested) concurrently
+MAX_IMPLEMENTATION_WORKERS = 8
+
+# Maximum size of an existing file passed on to code generation; larger
+# files are not modified, since the generated code replaces the whole file
+MAX_CONTENT_BYTES = 256 * 1024
+
+# Language -> (test frameworks in order of preference, fallback when none of
+# them was detected in the repository)
+_TEST_FRAMEWORK_PRIORITY = {
+    'JavaScript': (('Jest', 'Mocha'), None),
+    'TypeScript': (('Jest', 'Mocha'), None),
+    'Python': (('pytest',), 'unittest'),
+}
+_NO_TEST_FRAMEWORK_PRIORITY = ((), None)
+
+# Language -> test file name format; other languages use the default
+_TEST_NAME_FORMATS = {
+    'JavaScript': '{name}.test{ext}',
+    'TypeScript': '{name}.test{ext}',
+    'Python': 'test_{name}{ext}',
+    'Java': '{name}Test{ext}',
+    'Kotlin': '{name}Test{ext}',
+    'C#': '{name}Tests{ext}',
+}
+_DEFAULT_TEST_NAME_FORMAT = '{name}Test{ext}'
+
+# Number of primary-language files collected for code style analysis; the
+# language detector analyzes a sample of these
+MAX_STYLE_SAMPLE_FILES = 50
+
+# Repository analyses of clean Git checkouts, keyed on the checked-out commit
+# and shared by all managers, since each task gets its own manager and clone
+MAX_CACHED_ANALYSES = 32
+_analysis_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# Seconds allowed for each git command run to fingerprint a repository
+GIT_FINGERPRINT_TIMEOUT = 10
+
 class ImplementationManager:
     """Manage the implementation of tasks in the repository."""
     
     def __init__(self, 
                  repo_path: str, 
-                 code_generator: Optional[CodeGenerator] = None):
+                 code_generator: Optional['CodeGenerator'] = None):
         """
         Initialize the implementation manager.
         
@@ -30,10 +84,41 @@ class ImplementationManager:
             code_generator: CodeGenerator instance (optional).
         """
         self.repo_path = repo_path
-        self.language_detector = LanguageDetector(repo_path)
-        self.code_generator = code_generator or CodeGenerator()
-        self.git_handler = GitHandler(repository_url="", local_path=repo_path)
-        logger.info(f"Implementation manager initialized for repository at {repo_path}")
+        # The language detector, code generator and Git handler are created on
+        # first use; an explicitly passed code generator is used as is
+        if code_generator is not None:
+            self.code_generator = code_generator
+        # Extension -> language, and the reverse language -> extensions index
+        self._ext_to_lang = LanguageDetector.LANGUAGE_EXTENSIONS
+        lang_to_exts: Dict[str, set] = {}
+        for ext, lang in self._ext_to_lang.items():
+            lang_to_exts.setdefault(lang, set()).add(ext)
+        self._lang_to_exts = {lang: frozenset(exts) for lang, exts in lang_to_exts.items()}
+        # Directories known to exist, so repeated writes skip os.makedirs
+        self._created_dirs: set = set()
+        self._created_dirs_lock = threading.Lock()
+        # Language -> code style, analyzed once per language on first use
+        self._code_style_by_lang: Dict[str, Dict[str, Any]] = {}
+        # Repository-relative paths written since the last commit
+        self._pending_paths: List[str] = []
+        logger.info("Implementation manager initialized for repository at %s", repo_path)
+    
+    @cached_property
+    def language_detector(self) -> LanguageDetector:
+        """Language detector for the repository, created on first use."""
+        return LanguageDetector(self.repo_path)
+    
+    @cached_property
+    def code_generator(self) -> 'CodeGenerator':
+        """Code generator, created on first use unless one was passed in."""
+        from azure_devops_agent.implementation.code_generator import CodeGenerator
+        return CodeGenerator()
+    
+    @cached_property
+    def git_handler(self) -> 'GitHandler':
+        """Git handler for the repository, created on first use (only needed to commit)."""
+        from azure_devops_agent.repository.git_handler import GitHandler
+        return GitHandler(repository_url="", local_path=self.repo_path)
     
     def implement_task(self, task_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,6 +137,78 @@ class ImplementationManager:
         Returns:
             Dictionary with implementation results.
         """
+        repo_analysis, files_to_modify = self._prepare_task(task_details)
+        
+        # Create the code generator before worker threads share it
+        if files_to_modify:
+            _ = self.code_generator
+        
+        # Implement changes in each file; generation is network-bound, so files
+        # are handled concurrently (results keep the order of files_to_modify)
+        implementation_results = self._map_concurrently(
+            lambda file_info: self._implement_file_changes(file_info, task_details),
+            files_to_modify
+        )
+            
+        # Generate and run tests if required
+        test_results = []
+        if task_details.get('testing_required', False):
+            test_results = self._map_concurrently(
+                lambda implementation: self._generate_and_run_tests(implementation, task_details),
+                [implementation for implementation in implementation_results if implementation['status'] == 'success']
+            )
+        
+        return self._summarize_task(task_details, repo_analysis, implementation_results, test_results)
+    
+    async def implement_task_async(self, task_details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Implement a task in the repository without blocking the event loop.
+        
+        Same process as implement_task, but file implementations and tests are
+        generated with the code generator's async methods, at most
+        MAX_IMPLEMENTATION_WORKERS at a time, instead of in worker threads.
+        
+        Args:
+            task_details: Details of the task to implement.
+            
+        Returns:
+            Dictionary with implementation results.
+        """
+        # Repository analysis and file reads are blocking I/O
+        repo_analysis, files_to_modify = await asyncio.to_thread(self._prepare_task, task_details)
+        semaphore = asyncio.Semaphore(MAX_IMPLEMENTATION_WORKERS)
+        
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+        
+        implementation_results = list(await asyncio.gather(*(
+            bounded(self._implement_file_changes_async(file_info, task_details))
+            for file_info in files_to_modify
+        )))
+        
+        test_results = []
+        if task_details.get('testing_required', False):
+            test_results = list(await asyncio.gather(*(
+                bounded(self._generate_and_run_tests_async(implementation, task_details))
+                for implementation in implementation_results if implementation['status'] == 'success'
+            )))
+        
+        return self._summarize_task(task_details, repo_analysis, implementation_results, test_results)
+    
+    def _prepare_task(self, task_details: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Analyze the repository and determine the files to modify for a task.
+        
+        Also analyzes the code style of every language involved, so that
+        implementing the files needs no further repository reads.
+        
+        Args:
+            task_details: Details of the task; updated with the repository analysis.
+            
+        Returns:
+            Tuple of (repository analysis, file information dictionaries).
+        """
         # Analyze repository languages and frameworks
         repo_analysis = self._analyze_repository()
         
@@ -62,20 +219,33 @@ class ImplementationManager:
         
         # Determine files to modify based on task requirements
         files_to_modify = self._determine_files_to_modify(task_details)
+        for language in {file_info.get('language') for file_info in files_to_modify}:
+            self._code_style_for(language)
+        
+        return repo_analysis, files_to_modify
+    
+    @staticmethod
+    def _summarize_task(task_details: Dict[str, Any], 
+                        repo_analysis: Dict[str, Any],
+                        implementation_results: List[Dict[str, Any]],
+                        test_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Log and build the implementation summary for a task.
         
-        # Implement changes in each file
-        implementation_results = []
-        for file_info in files_to_modify:
-            result = self._implement_file_changes(file_info, task_details)
-            implementation_results.append(result)
+        Args:
+            task_details: Details of the task.
+            repo_analysis: Repository analysis results.
+            implementation_results: Per-file implementation results.
+            test_results: Per-file test results.
             
-        # Generate and run tests if required
-        test_results = []
-        if task_details.get('testing_required', False):
-            for implementation in implementation_results:
-                if implementation['status'] == 'success':
-                    test_result = self._generate_and_run_tests(implementation, task_details)
-                    test_results.append(test_result)
+        Returns:
+            Dictionary with implementation results.
+        """
+        succeeded = sum(1 for result in implementation_results if result['status'] == 'success')
+        logger.info("Implemented %d file(s) for task %s (%d succeeded, %d failed), generated %d test file(s)",
+                    len(implementation_results), task_details.get('id'), succeeded,
+                    len(implementation_results) - succeeded,
+                    sum(1 for result in test_results if result['status'] == 'generated'))
         
         # Return implementation summary
         return {
@@ -86,14 +256,50 @@ class ImplementationManager:
             'repository_analysis': repo_analysis
         }
     
+    @staticmethod
+    def _map_concurrently(func, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply func to each item in worker threads, preserving order.
+        
+        Args:
+            func: Function to apply; must not raise.
+            items: Items to process.
+            
+        Returns:
+            List of results in the order of items.
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_IMPLEMENTATION_WORKERS, len(items))) as executor:
+            return list(executor.map(func, items))
+    
     def _analyze_repository(self) -> Dict[str, Any]:
         """
         Analyze the repository to detect languages and frameworks.
         
+        Analyses of clean Git checkouts are cached by commit, so tasks on the
+        same commit of a repository share one analysis.
+        
         Returns:
             Dictionary with repository analysis results.
         """
-        # Detect programming languages
+        fingerprint = self._repository_fingerprint()
+        if fingerprint is not None:
+            with _analysis_cache_lock:
+                cached = _analysis_cache.get(fingerprint)
+                if cached is not None:
+                    _analysis_cache.move_to_end(fingerprint)
+            if cached is not None:
+                logger.debug("Reusing cached repository analysis")
+                analysis = copy.deepcopy(cached)
+                if analysis['primary_language']:
+                    self._code_style_by_lang.setdefault(analysis['primary_language'], analysis['code_style'])
+                return analysis
+        
+        # Detect programming languages; files may have been written since any
+        # previous analysis, so the detector must walk the repository again
+        self.language_detector.invalidate_file_index()
         languages = self.language_detector.detect_languages()
         
         # Get primary language (most used)
@@ -105,31 +311,104 @@ class ImplementationManager:
             frameworks = self.language_detector.detect_frameworks(primary_language)
         
         # Analyze code style for primary language
-        code_style = {}
-        if primary_language:
-            # Get some sample files for style analysis
-            file_paths = []
-            for root, _, files in os.walk(self.repo_path):
-                for file in files:
-                    _, ext = os.path.splitext(file)
-                    if ext[1:] in self.language_detector.LANGUAGE_EXTENSIONS:
-                        if self.language_detector.LANGUAGE_EXTENSIONS[ext[1:]] == primary_language:
-                            file_paths.append(os.path.join(root, file))
-                            if len(file_paths) >= 10:  # Limit to 10 files
-                                break
-                if len(file_paths) >= 10:
-                    break
-                    
-            if file_paths:
-                code_style = self.language_detector.analyze_code_style(primary_language, file_paths)
+        code_style = self._code_style_for(primary_language) if primary_language else {}
         
-        logger.info(f"Repository analysis: {len(languages)} languages, {len(frameworks)} frameworks detected")
-        return {
+        logger.info("Repository analysis: %d languages, %d frameworks detected", len(languages), len(frameworks))
+        analysis = {
             'languages': languages,
             'primary_language': primary_language,
             'frameworks': frameworks,
             'code_style': code_style
         }
+        
+        if fingerprint is not None:
+            with _analysis_cache_lock:
+                _analysis_cache[fingerprint] = copy.deepcopy(analysis)
+                if len(_analysis_cache) > MAX_CACHED_ANALYSES:
+                    _analysis_cache.popitem(last=False)
+        return analysis
+    
+    def _repository_fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint the repository by its checked-out commit.
+        
+        Returns:
+            The commit hash and the repository path's prefix within the
+            checkout, or None if the path is not in a Git checkout or the
+            checkout has changes (including untracked and ignored files).
+        """
+        try:
+            head = subprocess.run(
+                ['git', '-C', self.repo_path, 'rev-parse', '--show-prefix', 'HEAD'],
+                capture_output=True, text=True, check=True, timeout=GIT_FINGERPRINT_TIMEOUT
+            ).stdout
+            status = subprocess.run(
+                ['git', '-C', self.repo_path, 'status', '--porcelain', '--ignored'],
+                capture_output=True, text=True, check=True, timeout=GIT_FINGERPRINT_TIMEOUT
+            ).stdout
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug("Could not fingerprint repository: %s", e)
+            return None
+        
+        return None if status else head
+    
+    def _code_style_for(self, language: Optional[str]) -> Dict[str, Any]:
+        """
+        Return the code style for a language, analyzing sample files on first use.
+        
+        Args:
+            language: Language name.
+            
+        Returns:
+            Code style dictionary (empty if no files of the language were found).
+        """
+        if not language:
+            return {}
+        
+        code_style = self._code_style_by_lang.get(language)
+        if code_style is None:
+            file_paths = self._sample_files(language)
+            code_style = self.language_detector.analyze_code_style(language, file_paths) if file_paths else {}
+            code_style = self._code_style_by_lang.setdefault(language, code_style)
+        return code_style
+    
+    def _sample_files(self, language: str, limit: int = MAX_STYLE_SAMPLE_FILES) -> List[str]:
+        """
+        Collect up to limit files of a language, breadth-first from the repository root.
+        
+        Uses os.scandir so file type checks come from the directory listing
+        rather than a stat call per entry, and stops as soon as enough files are
+        found. Breadth-first order reaches shallow files first; os.fwalk was
+        not faster than this walk on Linux and only supports depth-first order.
+        
+        Args:
+            language: Language whose files to collect.
+            limit: Maximum number of files to return.
+            
+        Returns:
+            List of full file paths.
+        """
+        extensions = self._lang_to_exts.get(language, frozenset())
+        file_paths = []
+        pending = deque([self.repo_path])
+        
+        while pending:
+            try:
+                with os.scandir(pending.popleft()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not is_skipped_dir(entry.name):
+                                pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stem, dot, ext = entry.name.rpartition('.')
+                            if stem and ext.lower() in extensions:
+                                file_paths.append(entry.path)
+                                if len(file_paths) >= limit:
+                                    return file_paths
+            except OSError as e:
+                logger.debug("Skipping unreadable directory: %s", e)
+        
+        return file_paths
     
     def _determine_files_to_modify(self, task_details: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -141,54 +420,94 @@ class ImplementationManager:
         Returns:
             List of file information dictionaries.
         """
-        # Check if specific files are mentioned in the task
-        files_to_modify = []
-        
         # If specific files are mentioned in task requirements, use those
-        if 'files_to_modify' in task_details.get('requirements', {}):
-            explicit_files = task_details['requirements']['files_to_modify']
-            
-            for file_path in explicit_files:
-                # Check if file exists
-                full_path = os.path.join(self.repo_path, file_path)
-                
-                file_info = {
-                    'path': file_path,
-                    'full_path': full_path,
-                    'exists': os.path.exists(full_path),
-                    'action': 'modify' if os.path.exists(full_path) else 'create'
-                }
-                
-                # Detect language if file exists or based on extension
-                if file_info['exists']:
-                    # Read existing content
-                    with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        file_info['existing_content'] = f.read()
-                    
-                    # Detect language
-                    ext = os.path.splitext(file_path)[1][1:].lower()
-                    if ext in self.language_detector.LANGUAGE_EXTENSIONS:
-                        file_info['language'] = self.language_detector.LANGUAGE_EXTENSIONS[ext]
-                else:
-                    # Determine language based on extension for new files
-                    ext = os.path.splitext(file_path)[1][1:].lower()
-                    if ext in self.language_detector.LANGUAGE_EXTENSIONS:
-                        file_info['language'] = self.language_detector.LANGUAGE_EXTENSIONS[ext]
-                    else:
-                        # Use repository's primary language as fallback
-                        file_info['language'] = task_details.get('repository_analysis', {}).get('primary_language')
-                
-                files_to_modify.append(file_info)
-                
+        requirements = task_details.get('requirements') or _EMPTY
+        explicit_files = requirements.get('files_to_modify')
+        
         # If no explicit files are mentioned, try to infer based on task details
-        if not files_to_modify:
+        if not explicit_files:
             # This would be a more complex implementation in a real scenario
             # For now, we'll just indicate that we couldn't determine files
             logger.warning("No explicit files to modify, and inference not implemented")
+            return []
         
-        logger.info(f"Determined {len(files_to_modify)} files to modify")
+        primary_language = task_details.get('repository_analysis', {}).get('primary_language')
+        files_to_modify = []
+        for file_path in explicit_files:
+            # Check if file exists with a single stat call
+            full_path = os.path.join(self.repo_path, file_path)
+            try:
+                size = os.stat(full_path).st_size
+            except OSError:
+                files_to_modify.append(self._new_file_info(file_path, full_path, primary_language))
+            else:
+                files_to_modify.append(self._existing_file_info(file_path, full_path, size))
+        
+        logger.info("Determined %d files to modify", len(files_to_modify))
         return files_to_modify
     
+    def _new_file_info(self, file_path: str, full_path: str, primary_language: Optional[str]) -> Dict[str, Any]:
+        """
+        Build the file information dictionary for a file to create.
+        
+        Args:
+            file_path: Repository-relative path of the file.
+            full_path: Absolute path of the file.
+            primary_language: Repository's primary language, used for unknown extensions.
+            
+        Returns:
+            File information dictionary.
+        """
+        language = self._ext_to_lang.get(os.path.splitext(file_path)[1][1:].lower())
+        return {
+            'path': file_path,
+            'full_path': full_path,
+            'exists': False,
+            'action': 'create',
+            'size': 0,
+            'language': language if language is not None else primary_language
+        }
+    
+    def _existing_file_info(self, file_path: str, full_path: str, size: int) -> Dict[str, Any]:
+        """
+        Build the file information dictionary for an existing file to modify.
+        
+        Args:
+            file_path: Repository-relative path of the file.
+            full_path: Absolute path of the file.
+            size: Size of the file in bytes.
+            
+        Returns:
+            File information dictionary, including the existing content, or a
+            'read_error' if the file is too large or not UTF-8 text and must
+            not be rewritten.
+        """
+        file_info = {
+            'path': file_path,
+            'full_path': full_path,
+            'exists': True,
+            'action': 'modify',
+            'size': size
+        }
+        
+        # The generated implementation replaces the whole file, so only files
+        # that can be passed on in full and decoded losslessly are modified
+        if size > MAX_CONTENT_BYTES:
+            file_info['read_error'] = f"File is larger than {MAX_CONTENT_BYTES} bytes ({size} bytes)"
+        else:
+            try:
+                with open(full_path, 'rb') as f:
+                    file_info['existing_content'] = f.read().decode('utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                file_info['read_error'] = f"File cannot be read as UTF-8 text: {e}"
+        if 'read_error' in file_info:
+            logger.warning("Not modifying %s: %s", file_path, file_info['read_error'])
+        
+        language = self._ext_to_lang.get(os.path.splitext(file_path)[1][1:].lower())
+        if language is not None:
+            file_info['language'] = language
+        return file_info
+    
     def _implement_file_changes(self, 
                               file_info: Dict[str, Any], 
                               task_details: Dict[str, Any]) -> Dict[str, Any]:
@@ -202,52 +521,174 @@ class ImplementationManager:
         Returns:
             Dictionary with implementation results.
         """
-        file_path = file_info['path']
         language = file_info['language']
-        existing_content = file_info.get('existing_content')
-        
-        # Get code style for the language
-        code_style = task_details.get('repository_analysis', {}).get('code_style', {})
+        if 'read_error' in file_info:
+            return self._implementation_error(file_info, ValueError(file_info['read_error']))
         
         try:
+            if task_details.get('testing_required', False):
+                # Implementation and tests from one API call; the tests are
+                # saved by _generate_and_run_tests
+                sections = self.code_generator.generate_bundle(
+                    task_details,
+                    language,
+                    self._code_style_for(language),
+                    file_info['path'],
+                    file_info.get('existing_content'),
+                    include_docs=False,
+                    testing_framework=self._test_framework_for(language, task_details)
+                )
+                return self._save_implementation(file_info, sections['implementation'], sections.get('tests'))
+            
             # Generate implementation
             implementation = self.code_generator.generate_implementation(
                 task_details,
                 language,
-                code_style,
-                file_path,
-                existing_content
+                self._code_style_for(language),
+                file_info['path'],
+                file_info.get('existing_content')
             )
+            return self._save_implementation(file_info, implementation)
             
-            # Write implementation to file
-            full_path = file_info['full_path']
+        except Exception as e:
+            return self._implementation_error(file_info, e)
+    
+    async def _implement_file_changes_async(self, 
+                                            file_info: Dict[str, Any], 
+                                            task_details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Implement changes for a single file without blocking.
+        
+        Takes the same arguments as _implement_file_changes.
+        
+        Returns:
+            Dictionary with implementation results.
+        """
+        language = file_info['language']
+        if 'read_error' in file_info:
+            return self._implementation_error(file_info, ValueError(file_info['read_error']))
+        
+        try:
+            if task_details.get('testing_required', False):
+                sections = await self.code_generator.generate_bundle_async(
+                    task_details,
+                    language,
+                    self._code_style_for(language),
+                    file_info['path'],
+                    file_info.get('existing_content'),
+                    include_docs=False,
+                    testing_framework=self._test_framework_for(language, task_details)
+                )
+                return self._save_implementation(file_info, sections['implementation'], sections.get('tests'))
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            implementation = await self.code_generator.generate_implementation_async(
+                task_details,
+                language,
+                self._code_style_for(language),
+                file_info['path'],
+                file_info.get('existing_content')
+            )
+            return self._save_implementation(file_info, implementation)
             
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(implementation)
-                
-            logger.info(f"Successfully implemented changes for {file_path}")
+        except Exception as e:
+            return self._implementation_error(file_info, e)
+    
+    def _save_implementation(self, 
+                             file_info: Dict[str, Any], 
+                             implementation: str,
+                             tests: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Write a generated implementation to its file.
+        
+        Args:
+            file_info: Information about the file to modify.
+            implementation: Generated implementation.
+            tests: Unit tests generated along with the implementation, to be
+                saved by _generate_and_run_tests (optional).
             
-            return {
-                'status': 'success',
-                'file': file_path,
-                'language': language,
-                'action': file_info['action'],
-                'implementation': implementation
-            }
+        Returns:
+            Dictionary with implementation results.
+        """
+        file_path = file_info['path']
+        
+        # Write implementation to file
+        full_path = file_info['full_path']
+        
+        # Ensure directory exists
+        self._ensure_directory(os.path.dirname(full_path))
+        
+        self._write_file(full_path, implementation)
+        self._pending_paths.append(file_path)
             
-        except Exception as e:
-            logger.error(f"Error implementing changes for {file_path}: {str(e)}")
+        logger.debug("Implemented changes for %s", file_path)
+        
+        result = {
+            'status': 'success',
+            'file': file_path,
+            'language': file_info['language'],
+            'action': file_info['action'],
+            'implementation': implementation
+        }
+        if tests is not None:
+            result['tests'] = tests
+        return result
+    
+    @staticmethod
+    def _implementation_error(file_info: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """
+        Log and build the result for a failed implementation.
+        
+        Args:
+            file_info: Information about the file to modify.
+            error: The exception raised.
             
-            return {
-                'status': 'error',
-                'file': file_path,
-                'language': language,
-                'action': file_info['action'],
-                'error': str(e)
-            }
+        Returns:
+            Dictionary with implementation results.
+        """
+        logger.error("Error implementing changes for %s: %s", file_info['path'], error)
+        
+        return {
+            'status': 'error',
+            'file': file_info['path'],
+            'language': file_info['language'],
+            'action': file_info['action'],
+            'error': str(error)
+        }
+    
+    @staticmethod
+    def _write_file(full_path: str, content: str) -> None:
+        """
+        Write text to a file, encoding it once and writing it in a single call.
+        
+        Line endings are written as generated (no newline translation).
+        
+        Args:
+            full_path: Path of the file to write.
+            content: Text content.
+        """
+        data = content.encode('utf-8')
+        with open(full_path, 'wb', buffering=max(65536, len(data))) as f:
+            f.write(data)
+    
+    def _ensure_directory(self, directory: str) -> None:
+        """
+        Create a directory and its parents unless already done in this session.
+        
+        Args:
+            directory: Directory path.
+        """
+        if not directory or directory in self._created_dirs:
+            return
+        
+        os.makedirs(directory, exist_ok=True)
+        with self._created_dirs_lock:
+            # Parents exist too, so later siblings short-circuit
+            while directory and directory not in self._created_dirs:
+                self._created_dirs.add(directory)
+                parent = os.path.dirname(directory)
+                if parent == directory:
+                    break
+                directory = parent
     
     def _generate_and_run_tests(self, 
                               implementation_result: Dict[str, Any], 
@@ -271,57 +712,130 @@ class ImplementationManager:
             
         file_path = implementation_result['file']
         language = implementation_result['language']
-        implementation = implementation_result['implementation']
-        
-        # Determine framework (this would be more sophisticated in a real implementation)
-        framework = None
-        if language in ['JavaScript', 'TypeScript']:
-            if any(f in task_details.get('repository_analysis', {}).get('frameworks', {}) for f in ['Jest', 'Mocha']):
-                framework = 'Jest' if 'Jest' in task_details['repository_analysis']['frameworks'] else 'Mocha'
-        elif language == 'Python':
-            framework = 'pytest' if 'pytest' in task_details.get('repository_analysis', {}).get('frameworks', {}) else 'unittest'
         
         try:
-            # Generate tests
-            tests = self.code_generator.generate_unit_tests(
-                implementation,
-                language,
-                file_path,
-                framework
-            )
+            # Use the tests generated along with the implementation, if any
+            tests = implementation_result.pop('tests', None)
+            if tests is None:
+                tests = self.code_generator.generate_unit_tests(
+                    implementation_result['implementation'],
+                    language,
+                    file_path,
+                    self._test_framework_for(language, task_details)
+                )
+            return self._save_tests(file_path, language, tests)
             
-            # Determine test file path
-            test_file_path = self._get_test_file_path(file_path, language)
-            full_test_path = os.path.join(self.repo_path, test_file_path)
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(full_test_path), exist_ok=True)
-            
-            # Write tests to file
-            with open(full_test_path, 'w', encoding='utf-8') as f:
-                f.write(tests)
-                
-            # Run tests - in a real implementation, this would use the testing module
-            # to actually execute the tests
-            test_result = {
-                'status': 'generated',  # We're not actually running tests in this simplified example
-                'file': test_file_path,
-                'tests': tests
+        except Exception as e:
+            return self._test_error(file_path, e)
+    
+    async def _generate_and_run_tests_async(self, 
+                                            implementation_result: Dict[str, Any], 
+                                            task_details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate and run tests for an implementation without blocking.
+        
+        Takes the same arguments as _generate_and_run_tests.
+        
+        Returns:
+            Dictionary with test results.
+        """
+        if implementation_result['status'] != 'success':
+            return {
+                'status': 'skipped',
+                'file': implementation_result['file'],
+                'reason': 'Implementation failed'
             }
             
-            logger.info(f"Generated tests for {file_path} at {test_file_path}")
-            return test_result
+        file_path = implementation_result['file']
+        language = implementation_result['language']
+        
+        try:
+            tests = implementation_result.pop('tests', None)
+            if tests is None:
+                tests = await self.code_generator.generate_unit_tests_async(
+                    implementation_result['implementation'],
+                    language,
+                    file_path,
+                    self._test_framework_for(language, task_details)
+                )
+            return self._save_tests(file_path, language, tests)
             
         except Exception as e:
-            logger.error(f"Error generating/running tests for {file_path}: {str(e)}")
+            return self._test_error(file_path, e)
+    
+    @staticmethod
+    def _test_framework_for(language: str, task_details: Dict[str, Any]) -> Optional[str]:
+        """
+        Pick the preferred test framework for a language detected in the repository.
+        
+        Args:
+            language: Programming language.
+            task_details: Task details, including the repository analysis.
             
-            return {
-                'status': 'error',
-                'file': file_path,
-                'error': str(e)
-            }
+        Returns:
+            Test framework name, or None to let the code generator decide.
+        """
+        frameworks_present = task_details.get('repository_analysis', {}).get('frameworks', {})
+        candidates, fallback = _TEST_FRAMEWORK_PRIORITY.get(language, _NO_TEST_FRAMEWORK_PRIORITY)
+        return next((f for f in candidates if f in frameworks_present), fallback)
     
-    def _get_test_file_path(self, implementation_path: str, language: str) -> str:
+    def _save_tests(self, file_path: str, language: str, tests: str) -> Dict[str, Any]:
+        """
+        Write generated tests next to the implementation's test location.
+        
+        Args:
+            file_path: Repository-relative path of the implementation file.
+            language: Programming language.
+            tests: Generated tests.
+            
+        Returns:
+            Dictionary with test results.
+        """
+        # Determine test file path
+        test_file_path = self._get_test_file_path(file_path, language)
+        full_test_path = os.path.join(self.repo_path, test_file_path)
+        
+        # Ensure directory exists
+        self._ensure_directory(os.path.dirname(full_test_path))
+        
+        # Write tests to file
+        self._write_file(full_test_path, tests)
+        self._pending_paths.append(test_file_path)
+            
+        # Run tests - in a real implementation, this would use the testing module
+        # to actually execute the tests
+        test_result = {
+            'status': 'generated',  # We're not actually running tests in this simplified example
+            'file': test_file_path,
+            'tests': tests
+        }
+        
+        logger.debug("Generated tests for %s at %s", file_path, test_file_path)
+        return test_result
+    
+    @staticmethod
+    def _test_error(file_path: str, error: Exception) -> Dict[str, Any]:
+        """
+        Log and build the result for failed test generation.
+        
+        Args:
+            file_path: Repository-relative path of the implementation file.
+            error: The exception raised.
+            
+        Returns:
+            Dictionary with test results.
+        """
+        logger.error("Error generating/running tests for %s: %s", file_path, error)
+        
+        return {
+            'status': 'error',
+            'file': file_path,
+            'error': str(error)
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_test_file_path(implementation_path: str, language: str) -> str:
         """
         Determine test file path based on implementation path and language.
         
@@ -334,26 +848,12 @@ class ImplementationManager:
         """
         # This duplicates logic from CodeGenerator._get_test_file_path
         # In a real implementation, this would be refactored to avoid duplication
-        base_name = os.path.basename(implementation_path)
-        dir_name = os.path.dirname(implementation_path)
+        dir_name, base_name = os.path.split(implementation_path)
+        name, ext = os.path.splitext(base_name)
         
         # Handle language-specific test file naming conventions
-        if language in ['JavaScript', 'TypeScript']:
-            name, ext = os.path.splitext(base_name)
-            return os.path.join(dir_name, f"{name}.test{ext}")
-        elif language == 'Python':
-            name, ext = os.path.splitext(base_name)
-            return os.path.join(dir_name, f"test_{name}{ext}")
-        elif language in ['Java', 'Kotlin']:
-            name, ext = os.path.splitext(base_name)
-            return os.path.join(dir_name, f"{name}Test{ext}")
-        elif language == 'C#':
-            name, ext = os.path.splitext(base_name)
-            return os.path.join(dir_name, f"{name}Tests{ext}")
-        
-        # Default case
-        name, ext = os.path.splitext(base_name)
-        return os.path.join(dir_name, f"{name}Test{ext}")
+        test_name = _TEST_NAME_FORMATS.get(language, _DEFAULT_TEST_NAME_FORMAT).format(name=name, ext=ext)
+        return os.path.join(dir_name, test_name)
     
     def commit_changes(self, task_id: str, message: Optional[str] = None) -> str:
         """
@@ -366,9 +866,10 @@ class ImplementationManager:
         Returns:
             Commit hash.
         """
-        # Stage all changes
-        # In a real implementation, this would be more selective
-        self.git_handler.add_files(['.'])
+        # Stage only the files written since the last commit, so git does not
+        # rescan the whole working tree; stage everything if none are known
+        self.git_handler.add_files(list(dict.fromkeys(self._pending_paths)) or ['.'])
+        self._pending_paths.clear()
         
         # Create commit message if not provided
         if not message:
@@ -377,5 +878,5 @@ class ImplementationManager:
         # Commit changes
         commit_hash = self.git_handler.commit_changes(message)
         
-        logger.info(f"Committed changes for task {task_id}: {commit_hash}")
+        logger.info("Committed changes for task %s: %s", task_id, commit_hash)
         return commit_hash
\ No newline at end of file
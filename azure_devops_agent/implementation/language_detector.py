@@ -7,12 +7,192 @@ and identifying language-specific patterns to guide code implementation.
 
 import os
 import logging
+import mmap
+import multiprocessing
+import random
 import re
-from typing import Dict, List, Set, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import compress, repeat
+from operator import methodcaller, not_, sub
+from typing import Dict, FrozenSet, List, Set, Optional, Any, Tuple
 from collections import Counter
 
+# google-re2 can match all framework patterns in one pass with a pattern
+# set; fall back to one compiled regex per framework when it is not installed
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Directories pruned when walking a repository (dependencies, virtual
+# environments, bytecode caches, build output); hidden directories such as
+# .git, .venv or .tox are pruned as well. Shared with the implementation
+# manager so both see the same files
+SKIPPED_DIRS = frozenset({'node_modules', 'venv', '__pycache__', 'build', 'dist'})
+
+def is_skipped_dir(name: str) -> bool:
+    """
+    Check whether a directory is pruned when walking a repository.
+    
+    Args:
+        name: Directory name.
+        
+    Returns:
+        True for hidden directories and those in SKIPPED_DIRS.
+    """
+    return name.startswith('.') or name in SKIPPED_DIRS
+
+# Regex matching holds the GIL, so large framework scans are spread over
+# worker processes: files per worker task, and the number of files from
+# which starting the workers pays off
+FRAMEWORK_SCAN_CHUNK_SIZE = 64
+FRAMEWORK_SCAN_PARALLEL_THRESHOLD = 2000
+
+# Files larger than this (bundles, generated code, assets) are not scanned
+# for frameworks, nor are files with a NUL byte in their first BINARY_SNIFF_SIZE
+# bytes (binary files)
+MAX_FRAMEWORK_SCAN_FILE_SIZE = 1024 * 1024
+BINARY_SNIFF_SIZE = 4096
+
+# Framework markers (imports, decorators) appear near the top of a file, so
+# only this many leading bytes are scanned
+FRAMEWORK_SCAN_HEAD_SIZE = 64 * 1024
+
+# Code style is inferred from a sample of this many files; files outside the
+# size range (stubs such as empty __init__.py files, generated bundles) are
+# only sampled when there are no others
+MAX_STYLE_SAMPLE_FILES = 10
+MIN_STYLE_FILE_SIZE = 200
+MAX_STYLE_FILE_SIZE = 200 * 1000
+
+# Literals in nearly every source file, useless for ruling a pattern out
+_COMMON_KEYWORDS = frozenset({
+    'import', 'from', 'require', 'export', 'class', 'def', 'function',
+    'new', 'use', 'using', 'package', 'return', 'extends',
+})
+
+def _compile_pattern_set(patterns: Dict[str, List[str]]) -> Tuple[Optional[Any], List[str]]:
+    """
+    Compile framework patterns into a single RE2 pattern set.
+    
+    Args:
+        patterns: Dictionary mapping framework names to their patterns.
+        
+    Returns:
+        Tuple of (pattern set, framework name for each pattern index), or
+        (None, []) when RE2 is unavailable or rejects a pattern.
+    """
+    if re2 is None:
+        return None, []
+    
+    try:
+        pattern_set = re2.Set.SearchSet()
+        frameworks = []
+        for framework, framework_patterns in patterns.items():
+            for pattern in framework_patterns:
+                pattern_set.Add(pattern)
+                frameworks.append(framework)
+        pattern_set.Compile()
+    except Exception as e:
+        logger.warning("Falling back to per-framework regexes: %s", e)
+        return None, []
+    
+    return pattern_set, frameworks
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Find the most selective literal substring that every match of a regex pattern contains.
+    
+    Only the plain pattern syntax used by FRAMEWORK_PATTERNS is understood;
+    patterns with alternation or groups yield None. Common keywords such as
+    'import' are passed over in favour of names like 'pytest', since nearly
+    every file contains them.
+    
+    Args:
+        pattern: Regular expression pattern.
+        
+    Returns:
+        The longest required literal that is not a common keyword (or the
+        longest one if all are), or None if none could be found.
+    """
+    literals = []
+    current = []
+    
+    def end_literal() -> None:
+        if current:
+            literals.append(''.join(current))
+            current.clear()
+    
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal_char = None
+        if char == '\\':
+            escaped = pattern[i + 1]
+            # \s, \w, \b and friends are classes or anchors, not literals
+            if not escaped.isalnum():
+                literal_char = escaped
+            i += 2
+        elif char in '|()':
+            return None
+        elif char == '[':
+            i = pattern.index(']', i + 2 if pattern[i + 1] == ']' else i + 1) + 1
+        elif char not in '.^$*+?{':
+            literal_char = char
+            i += 1
+        else:
+            i += 1
+        
+        if literal_char is None:
+            end_literal()
+        elif i < len(pattern) and pattern[i] in '*?{':
+            # An optional or counted character may be absent from a match
+            end_literal()
+        else:
+            current.append(literal_char)
+            # A repeated character is present, but what follows may not be adjacent
+            if i < len(pattern) and pattern[i] == '+':
+                end_literal()
+    end_literal()
+    
+    selective = [literal for literal in literals if re.sub(r'\W', '', literal) not in _COMMON_KEYWORDS]
+    return max(selective or literals, key=len) if literals else None
+
+def _required_literals(patterns: List[str]) -> Tuple[Optional[bytes], ...]:
+    """
+    Find the required literal of each of a framework's patterns.
+    
+    Args:
+        patterns: The framework's regex patterns.
+        
+    Returns:
+        Tuple with the UTF-8 encoded literal of each pattern, or None for a
+        pattern without one.
+    """
+    literals = []
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        literals.append(literal.encode('utf-8') if literal else None)
+    return tuple(literals)
+
+def _group_by_normalized_language(language_extensions: Dict[str, str]) -> Dict[str, FrozenSet[str]]:
+    """
+    Invert an extension to language mapping.
+    
+    Args:
+        language_extensions: Dictionary mapping file extensions to language names.
+        
+    Returns:
+        Dictionary mapping each language's first word to its file extensions.
+    """
+    grouped: Dict[str, Set[str]] = {}
+    for extension, language in language_extensions.items():
+        grouped.setdefault(language.split(' ', 1)[0], set()).add(extension)
+    return {language: frozenset(extensions) for language, extensions in grouped.items()}
+
 class LanguageDetector:
     """Detect programming languages and frameworks in the repository."""
     
@@ -257,6 +437,49 @@ class LanguageDetector:
         ],
     }
     
+    # Frameworks associated with each language (simplified mapping; a real
+    # implementation would be more comprehensive)
+    LANGUAGE_FRAMEWORKS = {
+        'JavaScript': ['React', 'Angular', 'Vue', 'Express', 'Next.js'],
+        'TypeScript': ['React', 'Angular', 'Vue', 'Express', 'Next.js'],
+        'Python': ['Django', 'Flask', 'FastAPI', 'Pytest'],
+        'Java': ['Spring', 'JUnit'],
+        'C#': ['ASP.NET', 'Entity Framework', 'NUnit'],
+        'Ruby': ['Rails'],
+        'PHP': ['Laravel', 'Symfony'],
+        'Go': ['Gin'],
+        'Rust': ['Rocket', 'Actix'],
+    }
+    
+    # Lookup tables derived once from the mappings above: extensions per
+    # normalized language (the first word, so "TypeScript (React)" counts as
+    # "TypeScript"), and frameworks per language
+    _LANGUAGE_EXTENSION_SETS: Dict[str, FrozenSet[str]] = _group_by_normalized_language(LANGUAGE_EXTENSIONS)
+    _LANGUAGE_FRAMEWORK_SETS: Dict[str, FrozenSet[str]] = {
+        language: frozenset(frameworks) for language, frameworks in LANGUAGE_FRAMEWORKS.items()
+    }
+    
+    # Each framework's patterns compiled once; they are bytes patterns so
+    # memory-mapped files can be searched without decoding. They are kept
+    # separate rather than joined into one alternation, which would disable
+    # re's fast scan for a pattern's literal prefix
+    _COMPILED_FRAMEWORK_PATTERNS: Dict[str, Tuple[re.Pattern, ...]] = {
+        framework: tuple(re.compile(pattern.encode('utf-8')) for pattern in patterns)
+        for framework, patterns in FRAMEWORK_PATTERNS.items()
+    }
+    
+    # The most selective literal each framework pattern requires (None when a
+    # pattern has none); a substring search for it rules the pattern out
+    # before its regex runs
+    _FRAMEWORK_LITERALS: Dict[str, Tuple[Optional[bytes], ...]] = {
+        framework: _required_literals(patterns)
+        for framework, patterns in FRAMEWORK_PATTERNS.items()
+    }
+    
+    # All patterns in one RE2 set (None without google-re2), and the
+    # framework each pattern index belongs to
+    _FRAMEWORK_PATTERN_SET, _FRAMEWORK_PATTERN_SET_FRAMEWORKS = _compile_pattern_set(FRAMEWORK_PATTERNS)
+    
     def __init__(self, repo_path: str):
         """
         Initialize the language detector.
@@ -265,8 +488,53 @@ class LanguageDetector:
             repo_path: Path to the repository root directory.
         """
         self.repo_path = repo_path
+        # (file path, lowercase extension) of every file, filled on first use
+        self._file_index: Optional[List[Tuple[str, str]]] = None
+        # Detection results computed from the current index; language counts,
+        # and framework counts by language filter
+        self._language_counts: Optional[Dict[str, int]] = None
+        self._framework_counts: Dict[Optional[str], Dict[str, int]] = {}
         logger.info(f"Language detector initialized for repository at {repo_path}")
     
+    def _scan_repo(self) -> List[Tuple[str, str]]:
+        """
+        Walk the repository once and index its files.
+        
+        The index, and the detection results computed from it, are shared
+        by all detection methods; call invalidate_file_index() after the
+        repository changes.
+        
+        Returns:
+            List of (file path, lowercase extension without dot) tuples.
+        """
+        if self._file_index is None:
+            file_index = []
+            pending = [self.repo_path]
+            while pending:
+                try:
+                    with os.scandir(pending.pop()) as entries:
+                        for entry in entries:
+                            # DirEntry caches the type from the directory listing,
+                            # so most entries need no stat call; as with os.walk,
+                            # symlinked directories are not entered
+                            if entry.is_dir():
+                                if not is_skipped_dir(entry.name) and not entry.is_symlink():
+                                    pending.append(entry.path)
+                                continue
+                            
+                            _, extension = os.path.splitext(entry.name)
+                            file_index.append((entry.path, extension[1:].lower()))
+                except OSError as e:
+                    logger.debug("Skipping unreadable directory: %s", e)
+            self._file_index = file_index
+        return self._file_index
+    
+    def invalidate_file_index(self) -> None:
+        """Discard the file index and detection results so they are recomputed on next use."""
+        self._file_index = None
+        self._language_counts = None
+        self._framework_counts = {}
+    
     def detect_languages(self) -> Dict[str, int]:
         """
         Detect programming languages used in the repository based on file extensions.
@@ -274,25 +542,20 @@ class LanguageDetector:
         Returns:
             Dictionary mapping language names to their frequency (file count).
         """
+        if self._language_counts is not None:
+            return dict(self._language_counts)
+        
         language_counts = Counter()
         
-        # Walk through all files in the repository
-        for root, _, files in os.walk(self.repo_path):
-            # Skip .git directory
-            if '.git' in root.split(os.path.sep):
-                continue
-                
-            for file in files:
-                # Get file extension
-                _, extension = os.path.splitext(file)
-                extension = extension[1:].lower() if extension else ''
-                
-                # Map extension to language
-                if extension in self.LANGUAGE_EXTENSIONS:
-                    language = self.LANGUAGE_EXTENSIONS[extension]
-                    language_counts[language] += 1
+        # Map each file's extension to a language
+        language_extensions = self.LANGUAGE_EXTENSIONS
+        for _, extension in self._scan_repo():
+            language = language_extensions.get(extension)
+            if language is not None:
+                language_counts[language] += 1
         
         logger.info(f"Detected languages: {dict(language_counts)}")
+        self._language_counts = dict(language_counts)
         return dict(language_counts)
     
     def detect_frameworks(self, language: Optional[str] = None) -> Dict[str, int]:
@@ -305,68 +568,127 @@ class LanguageDetector:
         Returns:
             Dictionary mapping framework names to their detection confidence.
         """
-        framework_counts = Counter()
+        cached_counts = self._framework_counts.get(language)
+        if cached_counts is not None:
+            return dict(cached_counts)
         
         # Filter patterns based on language if specified
-        framework_patterns = self.FRAMEWORK_PATTERNS
+        framework_patterns = self._COMPILED_FRAMEWORK_PATTERNS
         if language:
             # This is a simplistic approach; in a real implementation,
             # you would have a more sophisticated mapping from language to frameworks
             framework_patterns = {k: v for k, v in framework_patterns.items() 
                                 if self._is_framework_for_language(k, language)}
+            
+            # Nothing can match, so skip reading the repository's files
+            if not framework_patterns:
+                logger.info("No known frameworks for %s", language)
+                return {}
         
         # Limit file extensions to check based on language
         extensions_to_check = self._get_extensions_for_language(language) if language else None
         
-        # Walk through appropriate files in the repository
-        for root, _, files in os.walk(self.repo_path):
-            # Skip .git directory
-            if '.git' in root.split(os.path.sep):
-                continue
-                
-            for file in files:
-                # Check if the file has an extension we care about
-                _, extension = os.path.splitext(file)
-                extension = extension[1:].lower() if extension else ''
-                
-                if extensions_to_check and extension not in extensions_to_check:
-                    continue
-                    
-                # Check file content for framework patterns
-                file_path = os.path.join(root, file)
-                try:
-                    self._check_file_for_frameworks(file_path, framework_patterns, framework_counts)
-                except Exception as e:
-                    logger.warning(f"Error checking file {file_path}: {str(e)}")
+        # Check appropriate files in the repository
+        file_paths = [file_path for file_path, extension in self._scan_repo()
+                      if not extensions_to_check or extension in extensions_to_check]
+        
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(file_paths) >= FRAMEWORK_SCAN_PARALLEL_THRESHOLD:
+            try:
+                framework_counts = self._scan_files_parallel(file_paths, tuple(framework_patterns), workers)
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel framework scan failed, scanning sequentially: {str(e)}")
+                framework_counts = _scan_files_for_frameworks(file_paths, tuple(framework_patterns))
+        else:
+            framework_counts = _scan_files_for_frameworks(file_paths, tuple(framework_patterns))
         
         logger.info(f"Detected frameworks: {dict(framework_counts)}")
+        self._framework_counts[language] = dict(framework_counts)
         return dict(framework_counts)
     
-    def _check_file_for_frameworks(self, 
+    @staticmethod
+    def _scan_files_parallel(file_paths: List[str], frameworks: Tuple[str, ...], workers: int) -> Counter:
+        """
+        Scan files for framework patterns in worker processes.
+        
+        Args:
+            file_paths: Paths of the files to check.
+            frameworks: Names of the frameworks to look for.
+            workers: Maximum number of worker processes.
+            
+        Returns:
+            Counter of files matching each framework.
+        """
+        chunks = [file_paths[i:i + FRAMEWORK_SCAN_CHUNK_SIZE]
+                  for i in range(0, len(file_paths), FRAMEWORK_SCAN_CHUNK_SIZE)]
+        counts = Counter()
+        
+        # Spawned rather than forked workers, since callers may be multi-threaded
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            for chunk_counts in executor.map(_scan_files_for_frameworks, chunks, repeat(frameworks)):
+                counts.update(chunk_counts)
+        
+        return counts
+    
+    @classmethod
+    def _check_file_for_frameworks(cls, 
                                   file_path: str, 
-                                  patterns: Dict[str, List[str]], 
+                                  patterns: Dict[str, Tuple[re.Pattern, ...]], 
                                   counts: Counter) -> None:
         """
         Check a single file for framework patterns.
         
         Args:
             file_path: Path to the file to check.
-            patterns: Dictionary of framework patterns.
+            patterns: Dictionary of compiled patterns per framework.
             counts: Counter to update with matches.
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Skip binary files
+        with open(file_path, 'rb') as f:
+            # Empty files cannot be mapped, and cannot match anything
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size > MAX_FRAMEWORK_SCAN_FILE_SIZE:
+                return
+            with mmap.mmap(f.fileno(), min(size, FRAMEWORK_SCAN_HEAD_SIZE), access=mmap.ACCESS_READ) as content:
+                # Skip binary files
+                if content.find(b'\x00', 0, BINARY_SNIFF_SIZE) != -1:
+                    return
+                cls._match_frameworks(content, patterns, counts)
+    
+    @classmethod
+    def _match_frameworks(cls, 
+                          content: mmap.mmap, 
+                          patterns: Dict[str, Tuple[re.Pattern, ...]], 
+                          counts: Counter) -> None:
+        """
+        Count the frameworks whose patterns match the head of a file's content.
+        
+        Args:
+            content: Memory-mapped file content.
+            patterns: Dictionary of compiled patterns per framework.
+            counts: Counter to update with matches.
+        """
+        # Scan once for all frameworks when RE2 is available; the RE2 set
+        # matches text, so the head is decoded for it (a character cut at the
+        # end of the head is dropped)
+        if cls._FRAMEWORK_PATTERN_SET is not None:
+            text = content[:FRAMEWORK_SCAN_HEAD_SIZE].decode('utf-8', errors='ignore')
+            pattern_frameworks = cls._FRAMEWORK_PATTERN_SET_FRAMEWORKS
+            matched = {pattern_frameworks[i] for i in cls._FRAMEWORK_PATTERN_SET.Match(text) or ()}
+            for framework in matched:
+                if framework in patterns:
+                    counts[framework] += 1
             return
             
-        # Check each framework's patterns
+        # Check each framework's patterns directly on the mapped bytes, each
+        # only when its required literal occurs; each framework counts once
+        # per file
+        framework_literals = cls._FRAMEWORK_LITERALS
         for framework, framework_patterns in patterns.items():
-            for pattern in framework_patterns:
-                if re.search(pattern, content):
-                    counts[framework] += 1
-                    break  # Only count each framework once per file
+            if any((literal is None or content.find(literal, 0, FRAMEWORK_SCAN_HEAD_SIZE) != -1)
+                   and pattern.search(content, 0, FRAMEWORK_SCAN_HEAD_SIZE)
+                   for literal, pattern in zip(framework_literals[framework], framework_patterns)):
+                counts[framework] += 1
     
     def _is_framework_for_language(self, framework: str, language: str) -> bool:
         """
@@ -379,25 +701,12 @@ class LanguageDetector:
         Returns:
             True if the framework is for the specified language.
         """
-        # This is a simplified mapping; a real implementation would be more comprehensive
-        language_frameworks = {
-            'JavaScript': ['React', 'Angular', 'Vue', 'Express', 'Next.js'],
-            'TypeScript': ['React', 'Angular', 'Vue', 'Express', 'Next.js'],
-            'Python': ['Django', 'Flask', 'FastAPI', 'Pytest'],
-            'Java': ['Spring', 'JUnit'],
-            'C#': ['ASP.NET', 'Entity Framework', 'NUnit'],
-            'Ruby': ['Rails'],
-            'PHP': ['Laravel', 'Symfony'],
-            'Go': ['Gin'],
-            'Rust': ['Rocket', 'Actix'],
-        }
-        
         # Handle language variations
-        normalized_language = language.split(' ')[0]  # e.g., "TypeScript (React)" -> "TypeScript"
+        normalized_language = language.split(' ', 1)[0]  # e.g., "TypeScript (React)" -> "TypeScript"
         
-        return framework in language_frameworks.get(normalized_language, [])
+        return framework in self._LANGUAGE_FRAMEWORK_SETS.get(normalized_language, frozenset())
     
-    def _get_extensions_for_language(self, language: str) -> Set[str]:
+    def _get_extensions_for_language(self, language: str) -> FrozenSet[str]:
         """
         Get file extensions associated with a language.
         
@@ -408,13 +717,9 @@ class LanguageDetector:
             Set of file extensions.
         """
         # Normalize language name
-        normalized_language = language.split(' ')[0]  # e.g., "TypeScript (React)" -> "TypeScript"
+        normalized_language = language.split(' ', 1)[0]  # e.g., "TypeScript (React)" -> "TypeScript"
         
-        # Get extensions that map to this language
-        extensions = {ext for ext, lang in self.LANGUAGE_EXTENSIONS.items() 
-                     if lang.split(' ')[0] == normalized_language}
-        
-        return extensions
+        return self._LANGUAGE_EXTENSION_SETS.get(normalized_language, frozenset())
     
     def analyze_code_style(self, language: str, file_paths: List[str]) -> Dict[str, Any]:
         """
@@ -435,6 +740,8 @@ class LanguageDetector:
             'bracing_style': None,
         }
         
+        file_paths = self._sample_style_files(file_paths)
+        
         if language in ['JavaScript', 'TypeScript']:
             style_info = self._analyze_js_ts_style(file_paths)
         elif language == 'Python':
@@ -447,6 +754,34 @@ class LanguageDetector:
         logger.info(f"Analyzed code style for {language}: {style_info}")
         return style_info
     
+    @staticmethod
+    def _sample_style_files(file_paths: List[str]) -> List[str]:
+        """
+        Pick the files to analyze for code style.
+        
+        Files of a typical source size are preferred, and a fixed-seed random
+        sample is taken so the result does not depend on which files the
+        caller happened to list first, yet is the same on every run.
+        
+        Args:
+            file_paths: Candidate file paths.
+            
+        Returns:
+            At most MAX_STYLE_SAMPLE_FILES file paths.
+        """
+        typical_paths = []
+        for file_path in file_paths:
+            try:
+                if MIN_STYLE_FILE_SIZE < os.path.getsize(file_path) < MAX_STYLE_FILE_SIZE:
+                    typical_paths.append(file_path)
+            except OSError:
+                continue
+        candidates = typical_paths or file_paths
+        
+        if len(candidates) <= MAX_STYLE_SAMPLE_FILES:
+            return candidates
+        return random.Random(0).sample(candidates, MAX_STYLE_SAMPLE_FILES)
+    
     def _analyze_js_ts_style(self, file_paths: List[str]) -> Dict[str, Any]:
         """
         Analyze JavaScript/TypeScript code style.
@@ -461,7 +796,8 @@ class LanguageDetector:
         space_indent_count = 0
         tab_indent_count = 0
         indent_sizes = Counter()
-        line_lengths = []
+        line_count = 0
+        total_line_length = 0
         
         # Function naming conventions
         camel_case_count = 0
@@ -475,35 +811,31 @@ class LanguageDetector:
         semicolon_count = 0
         no_semicolon_count = 0
         
-        for file_path in file_paths[:10]:  # Limit to 10 files for performance
+        for file_path in file_paths:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                for line in lines:
-                    # Check indentation
-                    if line.strip():
-                        indent = len(line) - len(line.lstrip())
-                        if indent > 0:
-                            if line[0] == '\t':
-                                tab_indent_count += 1
-                            else:
-                                space_indent_count += 1
-                                indent_sizes[indent] += 1
-                        
-                        # Check line length
-                        line_lengths.append(len(line.rstrip()))
-                        
-                        # Check semicolon usage
-                        stripped = line.strip()
-                        if stripped and not stripped.startswith('//') and not stripped.startswith('/*'):
-                            if stripped.endswith(';'):
-                                semicolon_count += 1
-                            elif re.match(r'^[^;]+$', stripped) and not stripped.endswith('{') and not stripped.endswith('}'):
-                                no_semicolon_count += 1
-                    
+                    content = f.read()
+                
+                # Check indentation and line length
+                lines = _non_blank_lines(content)
+                stripped_lines = list(map(str.lstrip, lines))
+                tab_indented, space_indents = _measure_indentation(lines, stripped_lines)
+                tab_indent_count += tab_indented
+                space_indent_count += sum(space_indents.values())
+                indent_sizes.update(space_indents)
+                line_count += len(lines)
+                total_line_length += sum(map(len, lines))
+                
+                # Check semicolon usage on the lines already stripped for
+                # the indentation check
+                for stripped in stripped_lines:
+                    if not stripped.startswith(('//', '/*')):
+                        if stripped.endswith(';'):
+                            semicolon_count += 1
+                        elif ';' not in stripped and not stripped.endswith(('{', '}')):
+                            no_semicolon_count += 1
+                
                 # Check function naming conventions
-                content = ''.join(lines)
                 camel_case_funcs = len(re.findall(r'function\s+([a-z][a-zA-Z0-9]*)', content))
                 snake_case_funcs = len(re.findall(r'function\s+([a-z][a-z0-9_]*)', content))
                 camel_case_count += camel_case_funcs
@@ -520,7 +852,7 @@ class LanguageDetector:
         style_info = {
             'indentation': 'tabs' if tab_indent_count > space_indent_count else 'spaces',
             'indent_size': indent_sizes.most_common(1)[0][0] if indent_sizes else 2,
-            'line_length': int(sum(line_lengths) / len(line_lengths)) if line_lengths else 80,
+            'line_length': int(total_line_length / line_count) if line_count else 80,
             'naming_conventions': {
                 'functions': 'camelCase' if camel_case_count > snake_case_count else 'snake_case'
             },
@@ -544,7 +876,8 @@ class LanguageDetector:
         space_indent_count = 0
         tab_indent_count = 0
         indent_sizes = Counter()
-        line_lengths = []
+        line_count = 0
+        total_line_length = 0
         
         # Naming conventions
         snake_case_count = 0
@@ -554,27 +887,22 @@ class LanguageDetector:
         single_quotes = 0
         double_quotes = 0
         
-        for file_path in file_paths[:10]:  # Limit to 10 files for performance
+        for file_path in file_paths:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                for line in lines:
-                    # Check indentation
-                    if line.strip():
-                        indent = len(line) - len(line.lstrip())
-                        if indent > 0:
-                            if line[0] == '\t':
-                                tab_indent_count += 1
-                            else:
-                                space_indent_count += 1
-                                indent_sizes[indent] += 1
-                        
-                        # Check line length
-                        line_lengths.append(len(line.rstrip()))
-                    
+                    content = f.read()
+                
+                # Check indentation and line length
+                lines = _non_blank_lines(content)
+                stripped_lines = list(map(str.lstrip, lines))
+                tab_indented, space_indents = _measure_indentation(lines, stripped_lines)
+                tab_indent_count += tab_indented
+                space_indent_count += sum(space_indents.values())
+                indent_sizes.update(space_indents)
+                line_count += len(lines)
+                total_line_length += sum(map(len, lines))
+                
                 # Check naming conventions
-                content = ''.join(lines)
                 snake_case_funcs = len(re.findall(r'def\s+([a-z][a-z0-9_]*)', content))
                 camel_case_funcs = len(re.findall(r'def\s+([a-z][a-zA-Z0-9]*)', content))
                 snake_case_count += snake_case_funcs
@@ -591,7 +919,7 @@ class LanguageDetector:
         style_info = {
             'indentation': 'tabs' if tab_indent_count > space_indent_count else 'spaces',
             'indent_size': indent_sizes.most_common(1)[0][0] if indent_sizes else 4,
-            'line_length': int(sum(line_lengths) / len(line_lengths)) if line_lengths else 79,
+            'line_length': int(total_line_length / line_count) if line_count else 79,
             'naming_conventions': {
                 'functions': 'snake_case' if snake_case_count > camel_case_count else 'camelCase'
             },
@@ -628,4 +956,62 @@ class LanguageDetector:
                 'variables': 'camelCase'
             },
             'bracing_style': 'new_line'
-        }
\ No newline at end of file
+        }
+
+def _non_blank_lines(content: str) -> List[str]:
+    """
+    Split text into its non-blank lines.
+    
+    Args:
+        content: File content.
+        
+    Returns:
+        Non-blank lines with trailing whitespace removed.
+    """
+    # map/filter run the per-line string operations in C rather than in an
+    # interpreted loop
+    return list(filter(None, map(str.rstrip, content.split('\n'))))
+
+def _measure_indentation(lines: List[str], stripped_lines: List[str]) -> Tuple[int, Counter]:
+    """
+    Count indented lines by indentation character.
+    
+    Args:
+        lines: Non-blank lines without trailing whitespace.
+        stripped_lines: The same lines without leading whitespace.
+        
+    Returns:
+        Tuple of (number of tab-indented lines, Counter of space-indented
+        lines by indent width).
+    """
+    tab_indented = list(map(methodcaller('startswith', '\t'), lines))
+    indent_widths = map(sub, map(len, lines), map(len, stripped_lines))
+    indent_sizes = Counter(compress(indent_widths, map(not_, tab_indented)))
+    # Lines at column zero are not indented
+    del indent_sizes[0]
+    return sum(tab_indented), indent_sizes
+
+def _scan_files_for_frameworks(file_paths: List[str], frameworks: Tuple[str, ...]) -> Counter:
+    """
+    Count the files matching each framework's patterns.
+    
+    Module-level so it can run in worker processes.
+    
+    Args:
+        file_paths: Paths of the files to check.
+        frameworks: Names of the frameworks to look for.
+        
+    Returns:
+        Counter of files matching each framework.
+    """
+    compiled_patterns = LanguageDetector._COMPILED_FRAMEWORK_PATTERNS
+    patterns = {framework: compiled_patterns[framework] for framework in frameworks}
+    counts = Counter()
+    
+    for file_path in file_paths:
+        try:
+            LanguageDetector._check_file_for_frameworks(file_path, patterns, counts)
+        except Exception as e:
+            logger.warning(f"Error checking file {file_path}: {str(e)}")
+    
+    return counts
@@ -77,18 +77,43 @@ class GitHandler:
             
         return self.repository_url
     
-    def clone_repository(self) -> str:
+    def clone_repository(self, 
+                         depth: Optional[int] = None,
+                         blob_filter: Optional[str] = None,
+                         single_branch: bool = False,
+                         branch: Optional[str] = None) -> str:
         """
         Clone the repository to the local path.
         
+        Args:
+            depth: Create a shallow clone with this many commits (optional).
+            blob_filter: Partial clone filter, e.g. "blob:none" (optional).
+            single_branch: Only fetch the history of a single branch.
+            branch: Branch to check out (default: the remote HEAD).
+            
         Returns:
             Path to the cloned repository.
         """
         auth_url = self._get_auth_url()
         
+        clone_options = {}
+        if depth:
+            clone_options['depth'] = depth
+        if blob_filter:
+            clone_options['filter'] = blob_filter
+        if single_branch:
+            clone_options['single_branch'] = True
+        if branch:
+            clone_options['branch'] = branch
+        
+        # git clone creates the target directory itself, but not its parents
+        parent_dir = os.path.dirname(self.local_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        
         try:
             logger.info(f"Cloning repository to {self.local_path}")
-            self.repo = Repo.clone_from(auth_url, self.local_path)
+            self.repo = Repo.clone_from(auth_url, self.local_path, **clone_options)
             return self.local_path
         except git.GitError as e:
             logger.error(f"Failed to clone repository: {str(e)}")
@@ -153,11 +178,14 @@ class GitHandler:
         Args:
             file_paths: List of file paths to add.
         """
+        if not file_paths:
+            return
+            
         repo = self.get_repository()
         
-        for file_path in file_paths:
-            logger.info(f"Adding file to staging area: {file_path}")
-            repo.git.add(file_path)
+        # Stage all paths with a single git invocation
+        logger.info(f"Adding {len(file_paths)} file(s) to staging area: {', '.join(file_paths)}")
+        repo.git.add('--', *file_paths)
     
     def commit_changes(self, message: str, author: Optional[str] = None) -> str:
         """
@@ -37,6 +37,8 @@ class CredentialManager:
             credential_store: Type of credential store to use ("keyring", "env", "azure").
         """
         self.credential_store = credential_store
+        # Azure DevOps PATs already retrieved in this process, keyed by organization
+        self._pat_cache: Dict[str, str] = {}
         logger.info(f"Credential manager initialized using {credential_store} store")
     
     def store_azure_devops_credentials(self, 
@@ -63,6 +65,7 @@ class CredentialManager:
                 organization,
                 personal_access_token
             )
+            self._pat_cache[organization] = personal_access_token
             logger.info(f"Stored Azure DevOps PAT for organization {organization}")
             return True
         except keyring.errors.KeyringError as e:
@@ -79,12 +82,18 @@ class CredentialManager:
         Returns:
             Personal access token or None if not found.
         """
+        # Reuse a PAT already retrieved in this process
+        pat = self._pat_cache.get(organization)
+        if pat:
+            return pat
+        
         # Try to get from keyring if using keyring store
         if self.credential_store == "keyring":
             try:
                 pat = keyring.get_password(self.KEYRING_SERVICE_AZURE_DEVOPS, organization)
                 if pat:
                     logger.info(f"Retrieved Azure DevOps PAT for organization {organization} from keyring")
+                    self._pat_cache[organization] = pat
                     return pat
             except keyring.errors.KeyringError as e:
                 logger.warning(f"Failed to get Azure DevOps PAT from keyring: {str(e)}")
@@ -98,6 +107,7 @@ class CredentialManager:
             
         if pat:
             logger.info(f"Retrieved Azure DevOps PAT from environment variable")
+            self._pat_cache[organization] = pat
             return pat
             
         # Try to get from Azure identity if using Azure store
@@ -302,6 +312,7 @@ class CredentialManager:
                         keyring.delete_password(self.KEYRING_SERVICE_AZURE_DEVOPS, org)
                     except keyring.errors.PasswordDeleteError:
                         pass
+                self._pat_cache.clear()
                 logger.info("Cleared Azure DevOps credentials")
                 
             if service in ["all", "github"]:
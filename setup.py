@@ -1,3 +1,5 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -6,6 +8,16 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = fh.read().splitlines()
 
+# Optionally compile the prompt-assembly hot path with mypyc (MYPYC_BUILD=1).
+# The module stays importable as pure Python for development installs.
+ext_modules = []
+if os.environ.get("MYPYC_BUILD") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "azure_devops_agent/implementation/code_generator.py",
+    ])
+
 setup(
     name="azure-devops-agent",
     version="0.1.0",
@@ -24,8 +36,9 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Build Tools",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=requirements,
+    ext_modules=ext_modules,
     extras_require={
         "dev": [
             "pytest>=7.0.0",
@@ -34,7 +47,20 @@ setup(
             "isort>=5.12.0",
             "flake8>=6.0.0",
             "pre-commit>=3.0.0",
-        ]
+        ],
+        "re2": [
+            "google-re2>=1.1",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.1",
+        ],
+        "semantic-cache": [
+            "sentence-transformers>=2.2.0",
+            "faiss-cpu>=1.7.4",
+        ],
+        "mypyc": [
+            "mypy>=1.0",
+        ],
     },
     entry_points={
         "console_scripts": [